@@ -57,7 +57,7 @@ from browser_use.agent.views import (
 from browser_use.browser.session import DEFAULT_BROWSER_PROFILE
 from browser_use.browser.views import BrowserStateSummary
 from browser_use.config import CONFIG
-from browser_use.dom.views import DOMInteractedElement
+from browser_use.dom.views import DOMInteractedElement, DOMSelectorMap
 from browser_use.filesystem.file_system import FileSystem
 from browser_use.observability import observe, observe_debug
 from browser_use.sync import CloudSync
@@ -1848,12 +1848,15 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		)
 		if not state or not history_item.model_output:
 			raise ValueError('Invalid state or model output')
+		# Hash the current selector map once for all actions in this step instead of per action
+		element_hash_to_index = self._build_element_hash_index(state.dom_state.selector_map)
 		updated_actions = []
 		for i, action in enumerate(history_item.model_output.action):
 			updated_action = await self._update_action_indices(
 				history_item.state.interacted_element[i],
 				action,
 				state,
+				element_hash_to_index,
 			)
 			updated_actions.append(updated_action)
 
@@ -1865,31 +1868,37 @@ class Agent(Generic[Context, AgentStructuredOutput]):
 		await asyncio.sleep(delay)
 		return result
 
+	@staticmethod
+	def _build_element_hash_index(selector_map: DOMSelectorMap) -> dict[int, int]:
+		"""Map element_hash -> highlight index, keeping the first index when hashes collide."""
+		element_hash_to_index: dict[int, int] = {}
+		for highlight_index, element in selector_map.items():
+			element_hash_to_index.setdefault(element.element_hash, highlight_index)
+		return element_hash_to_index
+
 	async def _update_action_indices(
 		self,
 		historical_element: DOMInteractedElement | None,
 		action: ActionModel,  # Type this properly based on your action model
 		browser_state_summary: BrowserStateSummary,
+		element_hash_to_index: dict[int, int] | None = None,
 	) -> ActionModel | None:
 		"""
 		Update action indices based on current page state.
 		Returns updated action or None if element cannot be found.
+
+		Pass a precomputed `element_hash_to_index` (see `_build_element_hash_index`) when updating several
+		actions against the same state, so the selector map is only hashed once.
 		"""
 		if not historical_element or not browser_state_summary.dom_state.selector_map:
 			return action
 
-		# selector_hash_map = {hash(e): e for e in browser_state_summary.dom_state.selector_map.values()}
+		if element_hash_to_index is None:
+			element_hash_to_index = self._build_element_hash_index(browser_state_summary.dom_state.selector_map)
 
-		highlight_index, current_element = next(
-			(
-				(highlight_index, element)
-				for highlight_index, element in browser_state_summary.dom_state.selector_map.items()
-				if element.element_hash == historical_element.element_hash
-			),
-			(None, None),
-		)
+		highlight_index = element_hash_to_index.get(historical_element.element_hash)
 
-		if not current_element or highlight_index is None:
+		if highlight_index is None:
 			return None
 
 		old_index = action.get_index()
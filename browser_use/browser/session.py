@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 from functools import cached_property
 from pathlib import Path
 from typing import Any, Literal, Self, cast
@@ -45,6 +46,7 @@ from browser_use.utils import _log_pretty_url, is_new_tab_page
 DEFAULT_BROWSER_PROFILE = BrowserProfile()
 
 _LOGGED_UNIQUE_SESSION_IDS = set()  # track unique session IDs that have been logged to make sure we always assign a unique enough id to new sessions and avoid ambiguity in logs
+_FRAME_TARGET_CACHE_TTL = 0.5  # seconds a frame_id -> target_id lookup in cdp_client_for_frame is reused for
 red = '\033[91m'
 reset = '\033[0m'
 
@@ -327,8 +329,12 @@ class BrowserSession(BaseModel):
 	# Mutable private state shared between watchdogs
 	_cdp_client_root: CDPClient | None = PrivateAttr(default=None)
 	_cdp_session_pool: dict[str, CDPSession] = PrivateAttr(default_factory=dict)
+	_cdp_sessions_connecting: dict[tuple[str, bool], asyncio.Task[CDPSession]] = PrivateAttr(
+		default_factory=dict
+	)  # (target_id, new_socket) -> pending connect
 	_cached_browser_state_summary: Any = PrivateAttr(default=None)
 	_cached_selector_map: dict[int, EnhancedDOMTreeNode] = PrivateAttr(default_factory=dict)
+	_frame_target_cache: dict[str, tuple[TargetID, float]] = PrivateAttr(default_factory=dict)  # frame_id -> (target_id, ts)
 	_downloaded_files: list[str] = PrivateAttr(default_factory=list)  # Track files downloaded during this session
 
 	# Watchdogs
@@ -389,10 +395,15 @@ class BrowserSession(BaseModel):
 			if hasattr(session, 'disconnect'):
 				await session.disconnect()
 		self._cdp_session_pool.clear()
+		# Connects started on the old connection must not put their sessions into the fresh pool
+		for connecting in self._cdp_sessions_connecting.values():
+			connecting.cancel()
+		self._cdp_sessions_connecting.clear()
 
 		self._cdp_client_root = None  # type: ignore
 		self._cached_browser_state_summary = None
 		self._cached_selector_map.clear()
+		self._frame_target_cache.clear()
 		self._downloaded_files.clear()
 
 		self.agent_focus = None
@@ -546,10 +557,14 @@ class BrowserSession(BaseModel):
 
 		target_id = None
 
+		# Fetch the page targets once and reuse them for the checks below instead of re-querying CDP
+		targets = await self._cdp_get_all_pages()
+
 		# If new_tab=True but we're already in a new tab, set new_tab=False
 		if event.new_tab:
 			try:
-				current_url = await self.get_current_page_url()
+				current_target = next((t for t in targets if t['targetId'] == self.agent_focus.target_id), None)
+				current_url = current_target.get('url', '') if current_target else await self.get_current_page_url()
 				from browser_use.utils import is_new_tab_page
 
 				if is_new_tab_page(current_url):
@@ -559,7 +574,6 @@ class BrowserSession(BaseModel):
 				self.logger.debug(f'[on_NavigateToUrlEvent] Could not check current URL: {e}')
 
 		# check if the url is already open in a tab somewhere that we're not currently on, if so, short-circuit and just switch to it
-		targets = await self._cdp_get_all_pages()
 		for target in targets:
 			if target.get('url') == event.url and target['targetId'] != self.agent_focus.target_id and not event.new_tab:
 				target_id = target['targetId']
@@ -572,7 +586,6 @@ class BrowserSession(BaseModel):
 			self.logger.debug(f'[on_NavigateToUrlEvent] Processing new_tab={event.new_tab}')
 			if event.new_tab:
 				# Look for existing about:blank tab that's not the current one
-				targets = await self._cdp_get_all_pages()
 				self.logger.debug(f'[on_NavigateToUrlEvent] Found {len(targets)} existing tabs')
 				current_target_id = self.agent_focus.target_id if self.agent_focus else None
 				self.logger.debug(f'[on_NavigateToUrlEvent] Current target_id: {current_target_id}')
@@ -592,7 +605,6 @@ class BrowserSession(BaseModel):
 					try:
 						target_id = await self._cdp_create_new_page('about:blank')
 						self.logger.debug(f'[on_NavigateToUrlEvent] Created new page with target_id: {target_id}')
-						targets = await self._cdp_get_all_pages()
 
 						self.logger.debug(f'Created new tab #{target_id[-4:]}')
 						# Dispatch TabCreatedEvent for new tab
@@ -638,8 +650,9 @@ class BrowserSession(BaseModel):
 			# # Wait a bit to ensure page starts loading
 			# await asyncio.sleep(0.5)
 
-			# Close any extension options pages that might have opened
-			await self._close_extension_options_pages()
+			# Close any extension options pages that might have opened (only possible when we load extensions ourselves)
+			if self._loads_extensions:
+				await self._close_extension_options_pages()
 
 			# Dispatch navigation complete
 			self.logger.debug(f'Dispatching NavigationCompleteEvent for {event.url} (tab #{target_id[-4:]})')
@@ -881,21 +894,27 @@ class BrowserSession(BaseModel):
 			self._cdp_session_pool[target_id] = self.agent_focus
 			return self.agent_focus
 
-		# Create new session for this target
+		# Create new session for this target (concurrent callers for the same target and socket mode share one
+		# attempt, otherwise each would open its own socket and all but the last would be orphaned from the pool)
 		# Default to True for new sessions (each new target gets its own WebSocket)
 		should_use_new_socket = True if new_socket is None else new_socket
-		self.logger.debug(
-			f'[get_or_create_cdp_session] Creating new CDP session for target {target_id} (new_socket={should_use_new_socket})'
-		)
-		session = await CDPSession.for_target(
-			self._cdp_client_root,
-			target_id,
-			new_socket=should_use_new_socket,
-			cdp_url=self.cdp_url if should_use_new_socket else None,
-		)
-		self._cdp_session_pool[target_id] = session
-		# log length of _cdp_session_pool
-		self.logger.debug(f'[get_or_create_cdp_session] new _cdp_session_pool length: {len(self._cdp_session_pool)}')
+		connecting_key = (target_id, should_use_new_socket)
+		connecting = self._cdp_sessions_connecting.get(connecting_key)
+		if connecting is None:
+			self.logger.debug(
+				f'[get_or_create_cdp_session] Creating new CDP session for target {target_id} (new_socket={should_use_new_socket})'
+			)
+			connecting = asyncio.create_task(self._connect_cdp_session(target_id, should_use_new_socket))
+			self._cdp_sessions_connecting[connecting_key] = connecting
+
+			def _on_connected(task: asyncio.Task[CDPSession]) -> None:
+				# only drop our own entry, a reset may have replaced it with a newer attempt
+				if self._cdp_sessions_connecting.get(connecting_key) is task:
+					del self._cdp_sessions_connecting[connecting_key]
+
+			connecting.add_done_callback(_on_connected)
+		# shielded so a cancelled caller doesn't abort the connection the others are waiting on
+		session = await asyncio.shield(connecting)
 
 		# Only change agent focus if requested
 		if focus:
@@ -912,6 +931,20 @@ class BrowserSession(BaseModel):
 
 		return session
 
+	async def _connect_cdp_session(self, target_id: TargetID, new_socket: bool) -> CDPSession:
+		"""Attach a new CDP session to a target and add it to the session pool."""
+		assert self._cdp_client_root is not None, 'Root CDP client not initialized - browser may not be connected yet'
+		session = await CDPSession.for_target(
+			self._cdp_client_root,
+			target_id,
+			new_socket=new_socket,
+			cdp_url=self.cdp_url if new_socket else None,
+		)
+		self._cdp_session_pool[target_id] = session
+		# log length of _cdp_session_pool
+		self.logger.debug(f'[get_or_create_cdp_session] new _cdp_session_pool length: {len(self._cdp_session_pool)}')
+		return session
+
 	@property
 	def current_target_id(self) -> str | None:
 		return self.agent_focus.target_id if self.agent_focus else None
@@ -1612,22 +1645,11 @@ class BrowserSession(BaseModel):
 			# Remove highlights via JavaScript - be thorough
 			script = """
 			(function() {
-				// Remove all browser-use highlight elements
-				const highlights = document.querySelectorAll('[data-browser-use-highlight]');
+				// Remove all browser-use highlight elements (incl. tooltips) and the highlight container in a single DOM sweep
+				const highlights = document.querySelectorAll('[data-browser-use-highlight], #browser-use-debug-highlights');
 				console.log('Removing', highlights.length, 'browser-use highlight elements');
 				highlights.forEach(el => el.remove());
 				
-				// Also remove by ID in case selector missed anything
-				const highlightContainer = document.getElementById('browser-use-debug-highlights');
-				if (highlightContainer) {
-					console.log('Removing highlight container by ID');
-					highlightContainer.remove();
-				}
-				
-				// Final cleanup - remove any orphaned tooltips
-				const orphanedTooltips = document.querySelectorAll('[data-browser-use-highlight="tooltip"]');
-				orphanedTooltips.forEach(el => el.remove());
-				
 				return { removed: highlights.length };
 			})();
 			"""
@@ -1645,6 +1667,15 @@ class BrowserSession(BaseModel):
 		except Exception as e:
 			self.logger.warning(f'Failed to remove highlights: {e}')
 
+	@property
+	def _loads_extensions(self) -> bool:
+		"""Whether this session launches the browser with extensions that may open options/welcome pages."""
+		if not self.is_local:
+			# extension args only apply to browsers we launch ourselves, never close a remote user's extension pages
+			return False
+		profile = self.browser_profile
+		return profile.enable_default_extensions or any(arg.startswith('--load-extension') for arg in profile.args)
+
 	async def _close_extension_options_pages(self) -> None:
 		"""Close any extension options/welcome pages that have opened."""
 		try:
@@ -2128,6 +2159,9 @@ class BrowserSession(BaseModel):
 			all_frames: Frame hierarchy dict to populate
 			target_sessions: Active target sessions
 		"""
+		# Frames whose owner node can be looked up from their parent's session: (frame_id, frame_info, parent_session_id)
+		owner_lookups: list[tuple[str, dict, str]] = []
+
 		for frame_id_iter, frame_info in all_frames.items():
 			parent_frame_id = frame_info.get('parentFrameId')
 
@@ -2141,23 +2175,33 @@ class BrowserSession(BaseModel):
 				# Try to get backend node ID from parent context
 				if parent_target_id in target_sessions:
 					assert parent_target_id is not None
-					parent_session_id = target_sessions[parent_target_id]
-					try:
-						# Enable DOM domain
-						await self.cdp_client.send.DOM.enable(session_id=parent_session_id)
+					owner_lookups.append((frame_id_iter, frame_info, target_sessions[parent_target_id]))
 
-						# Get frame owner info to find backend node ID
-						frame_owner = await self.cdp_client.send.DOM.getFrameOwner(
-							params={'frameId': frame_id_iter}, session_id=parent_session_id
-						)
+		if not owner_lookups:
+			return
 
-						if frame_owner:
-							frame_info['backendNodeId'] = frame_owner.get('backendNodeId')
-							frame_info['nodeId'] = frame_owner.get('nodeId')
+		# Enable DOM domain once per parent session instead of once per frame
+		parent_session_ids = {parent_session_id for _, _, parent_session_id in owner_lookups}
+		await asyncio.gather(
+			*(self.cdp_client.send.DOM.enable(session_id=parent_session_id) for parent_session_id in parent_session_ids),
+			return_exceptions=True,
+		)
 
-					except Exception:
-						# Frame owner not available (likely cross-origin)
-						pass
+		# Get frame owner info to find backend node IDs, all frames in one round-trip window
+		frame_owners = await asyncio.gather(
+			*(
+				self.cdp_client.send.DOM.getFrameOwner(params={'frameId': frame_id_iter}, session_id=parent_session_id)
+				for frame_id_iter, _, parent_session_id in owner_lookups
+			),
+			return_exceptions=True,
+		)
+
+		for (_, frame_info, _), frame_owner in zip(owner_lookups, frame_owners):
+			# Frame owner not available (likely cross-origin)
+			if isinstance(frame_owner, BaseException) or not frame_owner:
+				continue
+			frame_info['backendNodeId'] = frame_owner.get('backendNodeId')
+			frame_info['nodeId'] = frame_owner.get('nodeId')
 
 	async def find_frame_target(self, frame_id: str, all_frames: dict[str, dict] | None = None) -> dict | None:
 		"""Find the frame info for a specific frame ID.
@@ -2196,6 +2240,15 @@ class BrowserSession(BaseModel):
 		if not self.browser_profile.cross_origin_iframes:
 			return await self.get_or_create_cdp_session()
 
+		# Bursts of actions on elements in the same frame reuse the last lookup for a short while,
+		# rebuilding the full frame hierarchy costs a getTargets + getFrameTree per target
+		cached = self._frame_target_cache.get(frame_id)
+		if cached:
+			target_id, cached_at = cached
+			if time.monotonic() - cached_at < _FRAME_TARGET_CACHE_TTL and target_id in self._cdp_session_pool:
+				return await self.get_or_create_cdp_session(target_id, focus=False)
+			del self._frame_target_cache[frame_id]
+
 		# Get complete frame hierarchy
 		all_frames, target_sessions = await self.get_all_frames()
 
@@ -2207,8 +2260,17 @@ class BrowserSession(BaseModel):
 
 			if target_id in target_sessions:
 				assert target_id is not None
-				# Use existing session
-				session_id = target_sessions[target_id]
+				now = time.monotonic()
+				# Drop expired lookups on each miss so the cache stays bounded by the frames touched within the TTL.
+				# Entries are always (re)inserted at the end, so the dict is ordered by timestamp and the
+				# expired ones are all at the front
+				while self._frame_target_cache:
+					oldest_frame_id, (_, cached_at) = next(iter(self._frame_target_cache.items()))
+					if now - cached_at < _FRAME_TARGET_CACHE_TTL:
+						break
+					del self._frame_target_cache[oldest_frame_id]
+				self._frame_target_cache.pop(frame_id, None)
+				self._frame_target_cache[frame_id] = (target_id, now)
 				# Return the client with session attached (don't change focus)
 				return await self.get_or_create_cdp_session(target_id, focus=False)
 
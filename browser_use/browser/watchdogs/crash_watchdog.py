@@ -17,6 +17,7 @@ from browser_use.browser.events import (
 	TabCreatedEvent,
 )
 from browser_use.browser.watchdog_base import BaseWatchdog
+from browser_use.utils import BoundedDict
 
 if TYPE_CHECKING:
 	pass
@@ -25,6 +26,8 @@ if TYPE_CHECKING:
 class NetworkRequestTracker:
 	"""Tracks ongoing network requests."""
 
+	__slots__ = ('request_id', 'start_time', 'url', 'method', 'resource_type')
+
 	def __init__(self, request_id: str, start_time: float, url: str, method: str, resource_type: str | None = None):
 		self.request_id = request_id
 		self.start_time = start_time
@@ -53,7 +56,9 @@ class CrashWatchdog(BaseWatchdog):
 	_monitoring_task: asyncio.Task | None = PrivateAttr(default=None)
 	_last_responsive_checks: dict[str, float] = PrivateAttr(default_factory=dict)  # target_url -> timestamp
 	_cdp_event_tasks: set[asyncio.Task] = PrivateAttr(default_factory=set)  # Track CDP event handler tasks
-	_sessions_with_listeners: set[str] = PrivateAttr(default_factory=set)  # Track sessions that already have event listeners
+	_sessions_with_listeners: BoundedDict[str, bool] = PrivateAttr(
+		default_factory=lambda: BoundedDict(maxsize=256)
+	)  # Track sessions that already have event listeners
 
 	async def on_BrowserConnectedEvent(self, event: BrowserConnectedEvent) -> None:
 		"""Start monitoring when browser is connected."""
@@ -117,7 +122,7 @@ class CrashWatchdog(BaseWatchdog):
 			cdp_session.cdp_client.register.Target.targetCrashed(on_target_crashed)
 
 			# Track that we've added listeners to this session
-			self._sessions_with_listeners.add(cdp_session.session_id)
+			self._sessions_with_listeners[cdp_session.session_id] = True
 
 			# Get target info for logging
 			targets = await cdp_session.cdp_client.send.Target.getTargets()
@@ -133,9 +138,11 @@ class CrashWatchdog(BaseWatchdog):
 		request_id = event.get('requestId', '')
 		request = event.get('request', {})
 
+		# Redirects reuse the request ID, re-insert so the dict stays ordered by start time
+		self._active_requests.pop(request_id, None)
 		self._active_requests[request_id] = NetworkRequestTracker(
 			request_id=request_id,
-			start_time=time.time(),
+			start_time=time.monotonic(),
 			url=request.get('url', ''),
 			method=request.get('method', ''),
 			resource_type=event.get('type'),
@@ -146,18 +153,18 @@ class CrashWatchdog(BaseWatchdog):
 		"""Remove request from tracking on response."""
 		request_id = event.get('requestId', '')
 		if request_id in self._active_requests:
-			elapsed = time.time() - self._active_requests[request_id].start_time
+			elapsed = time.monotonic() - self._active_requests[request_id].start_time
 			response = event.get('response', {})
-			self.logger.debug(f'[CrashWatchdog] Request completed in {elapsed:.2f}s: {response.get("url", "")[:50]}...')
+			self.logger.debug('[CrashWatchdog] Request completed in %.2fs: %s...', elapsed, response.get('url', '')[:50])
 			# Don't remove yet - wait for loadingFinished
 
 	def _on_request_failed_cdp(self, event: dict) -> None:
 		"""Remove request from tracking on failure."""
 		request_id = event.get('requestId', '')
 		if request_id in self._active_requests:
-			elapsed = time.time() - self._active_requests[request_id].start_time
+			elapsed = time.monotonic() - self._active_requests[request_id].start_time
 			self.logger.debug(
-				f'[CrashWatchdog] Request failed after {elapsed:.2f}s: {self._active_requests[request_id].url[:50]}...'
+				'[CrashWatchdog] Request failed after %.2fs: %s...', elapsed, self._active_requests[request_id].url[:50]
 			)
 			del self._active_requests[request_id]
 
@@ -249,22 +256,29 @@ class CrashWatchdog(BaseWatchdog):
 
 	async def _check_network_timeouts(self) -> None:
 		"""Check for network requests exceeding timeout."""
-		current_time = time.time()
+		current_time = time.monotonic()
 		timed_out_requests = []
 
 		# Debug logging
 		if self._active_requests:
 			self.logger.debug(
-				f'[CrashWatchdog] Checking {len(self._active_requests)} active requests for timeouts (threshold: {self.network_timeout_seconds}s)'
+				'[CrashWatchdog] Checking %d active requests for timeouts (threshold: %ss)',
+				len(self._active_requests),
+				self.network_timeout_seconds,
 			)
 
+		# Requests are tracked in the order they started, so the timed out ones are all at the front
 		for request_id, tracker in self._active_requests.items():
 			elapsed = current_time - tracker.start_time
 			self.logger.debug(
-				f'[CrashWatchdog] Request {tracker.url[:30]}... elapsed: {elapsed:.1f}s, timeout: {self.network_timeout_seconds}s'
+				'[CrashWatchdog] Request %s... elapsed: %.1fs, timeout: %ss',
+				tracker.url[:30],
+				elapsed,
+				self.network_timeout_seconds,
 			)
-			if elapsed >= self.network_timeout_seconds:
-				timed_out_requests.append((request_id, tracker))
+			if elapsed < self.network_timeout_seconds:
+				break
+			timed_out_requests.append((request_id, tracker))
 
 		# Emit events for timed out requests
 		for request_id, tracker in timed_out_requests:
@@ -294,11 +308,14 @@ class CrashWatchdog(BaseWatchdog):
 
 		try:
 			try:
-				self.logger.debug(f'[CrashWatchdog] Checking browser health for target {self.browser_session.agent_focus}')
+				self.logger.debug('[CrashWatchdog] Checking browser health for target %s', self.browser_session.agent_focus)
 				cdp_session = await self.browser_session.get_or_create_cdp_session()
 			except Exception as e:
 				self.logger.debug(
-					f'[CrashWatchdog] Checking browser health for target {self.browser_session.agent_focus} error: {type(e).__name__}: {e}'
+					'[CrashWatchdog] Checking browser health for target %s error: %s: %s',
+					self.browser_session.agent_focus,
+					type(e).__name__,
+					e,
 				)
 				self.agent_focus = cdp_session = await self.browser_session.get_or_create_cdp_session(
 					target_id=self.agent_focus.target_id, new_socket=True, focus=True
@@ -306,22 +323,38 @@ class CrashWatchdog(BaseWatchdog):
 
 			for target in (await self.browser_session.cdp_client.send.Target.getTargets()).get('targetInfos', []):
 				if target.get('type') == 'page':
-					cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target.get('targetId'))
+					# Only new tab pages need a session of their own here, and fetching it must not move the agent's focus
 					if self._is_new_tab_page(target.get('url')) and target.get('url') != 'about:blank':
 						self.logger.debug(
-							f'[CrashWatchdog] Redirecting chrome://new-tab-page/ to about:blank {target.get("url")}'
+							'[CrashWatchdog] Redirecting chrome://new-tab-page/ to about:blank %s', target.get('url')
 						)
-						await cdp_session.cdp_client.send.Page.navigate(
-							params={'url': 'about:blank'}, session_id=cdp_session.session_id
+						new_tab_session = await self.browser_session.get_or_create_cdp_session(
+							target_id=target.get('targetId'), focus=False
+						)
+						await new_tab_session.cdp_client.send.Page.navigate(
+							params={'url': 'about:blank'}, session_id=new_tab_session.session_id
 						)
 
-			# Quick ping to check if session is alive
-			self.logger.debug(f'[CrashWatchdog] Attempting to run simple JS test expression in session {cdp_session} 1+1')
-			await asyncio.wait_for(
-				cdp_session.cdp_client.send.Runtime.evaluate(params={'expression': '1+1'}, session_id=cdp_session.session_id),
-				timeout=1.0,
-			)
-			self.logger.debug(f'[CrashWatchdog] Browser health check passed for target {self.browser_session.agent_focus}')
+			# Skip the ping if a DOM build on this target finished within the last check interval,
+			# the session was answering CDP calls moments ago (crashes are still caught via Target.targetCrashed)
+			dom_watchdog = self.browser_session._dom_watchdog
+			last_dom_rebuild = dom_watchdog._last_dom_rebuild if dom_watchdog else None
+			if (
+				last_dom_rebuild
+				and last_dom_rebuild[0] == cdp_session.target_id
+				and time.monotonic() - last_dom_rebuild[1] < self.check_interval_seconds
+			):
+				self.logger.debug('[CrashWatchdog] Skipping ping, DOM was rebuilt recently for target %s', cdp_session.target_id)
+			else:
+				# Quick ping to check if session is alive
+				self.logger.debug('[CrashWatchdog] Attempting to run simple JS test expression in session %s 1+1', cdp_session)
+				await asyncio.wait_for(
+					cdp_session.cdp_client.send.Runtime.evaluate(
+						params={'expression': '1+1', 'silent': True}, session_id=cdp_session.session_id
+					),
+					timeout=1.0,
+				)
+			self.logger.debug('[CrashWatchdog] Browser health check passed for target %s', self.browser_session.agent_focus)
 		except Exception as e:
 			self.logger.error(
 				f'[CrashWatchdog] ❌ Crashed session detected for target {self.browser_session.agent_focus} error: {type(e).__name__}: {e}'
@@ -330,7 +363,7 @@ class CrashWatchdog(BaseWatchdog):
 			if self.browser_session.agent_focus and (target_id := self.browser_session.agent_focus.target_id):
 				if session := self.browser_session._cdp_session_pool.pop(target_id, None):
 					await session.disconnect()
-					self.logger.debug(f'[CrashWatchdog] Removed crashed session from pool: {target_id}')
+					self.logger.debug('[CrashWatchdog] Removed crashed session from pool: %s', target_id)
 			self.browser_session.agent_focus.target_id = None  # type: ignore
 
 		# Check browser process if we have PID
@@ -1,9 +1,13 @@
 """Default browser action handlers using CDP."""
 
 import asyncio
+import functools
 import json
+import logging
 import platform
 
+from pydantic import PrivateAttr
+
 from browser_use.browser.events import (
 	ClickElementEvent,
 	GetDropdownOptionsEvent,
@@ -21,6 +25,7 @@ from browser_use.browser.events import (
 from browser_use.browser.views import BrowserError, URLNotAllowedError
 from browser_use.browser.watchdog_base import BaseWatchdog
 from browser_use.dom.service import EnhancedDOMTreeNode
+from browser_use.utils import BoundedDict
 
 # Import EnhancedDOMTreeNode and rebuild event models that have forward references to it
 # This must be done after all imports are complete
@@ -31,10 +36,103 @@ TypeTextEvent.model_rebuild()
 ScrollEvent.model_rebuild()
 UploadFileEvent.model_rebuild()
 
+# CDP modifier bits for the modifier names accepted in send_keys combinations
+_KEY_MODIFIER_BITS = {'alt': 1, 'option': 1, 'ctrl': 2, 'control': 2, 'meta': 4, 'cmd': 4, 'command': 4, 'shift': 8}
+
+# send_keys names for non-character keys -> CDP key names
+_SPECIAL_KEYS = {
+	'enter': 'Enter',
+	'return': 'Enter',
+	'tab': 'Tab',
+	'delete': 'Delete',
+	'backspace': 'Backspace',
+	'escape': 'Escape',
+	'esc': 'Escape',
+	'space': ' ',
+	'up': 'ArrowUp',
+	'down': 'ArrowDown',
+	'left': 'ArrowLeft',
+	'right': 'ArrowRight',
+	'pageup': 'PageUp',
+	'pagedown': 'PageDown',
+	'home': 'Home',
+	'end': 'End',
+}
+
+# Virtual key codes for proper key identification
+_SPECIAL_KEY_CODES = {
+	'enter': 13,
+	'return': 13,
+	'tab': 9,
+	'escape': 27,
+	'esc': 27,
+	'space': 32,
+	'backspace': 8,
+	'delete': 46,
+	'up': 38,
+	'down': 40,
+	'left': 37,
+	'right': 39,
+	'home': 36,
+	'end': 35,
+	'pageup': 33,
+	'pagedown': 34,
+}
+
+# Scrolls to the first element containing the given text, returns the strategy that found it or null
+_SCROLL_TO_TEXT_JS = """
+(text) => {
+	const literal = !text.includes('"') ? `"${text}"` : !text.includes("'") ? `'${text}'`
+		: `concat("${text.split('"').join(`", '"', "`)}")`;
+	// [query, matches text content only]
+	const queries = [
+		[`//*[contains(text(), ${literal})]`, true],
+		[`//*[contains(., ${literal})]`, true],
+		[`//*[@*[contains(., ${literal})]]`, false],
+	];
+	// Same-origin iframes are searched too; cross-origin ones have no contentDocument
+	const docs = [document];
+	for (const iframe of document.querySelectorAll('iframe')) {
+		try { if (iframe.contentDocument) docs.push(iframe.contentDocument); } catch (e) {}
+	}
+	// Any element's text is a substring of its document's textContent, so one substring test per
+	// document rules out the text queries (contains(., ...) alone is quadratic in DOM size)
+	const docHasText = docs.map(doc => (doc.documentElement?.textContent || '').includes(text));
+	for (const [query, textOnly] of queries) {
+		for (const [i, doc] of docs.entries()) {
+			if (textOnly && !docHasText[i]) continue;
+			try {
+				const match = doc.evaluate(query, doc, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+				if (match) {
+					match.scrollIntoView({block: 'center'});
+					return 'xpath';
+				}
+			} catch (e) {}
+		}
+	}
+	if (!document.body || !docHasText[0]) return null;
+	const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT, null, false);
+	let node;
+	while (node = walker.nextNode()) {
+		if (node.textContent.includes(text)) {
+			node.parentElement.scrollIntoView({behavior: 'smooth', block: 'center'});
+			return 'walker';
+		}
+	}
+	return null;
+}
+"""
+
 
 class DefaultActionWatchdog(BaseWatchdog):
 	"""Handles default browser actions like click, type, and scroll using CDP."""
 
+	# Sessions that already have Page.setLifecycleEventsEnabled turned on and the page load listeners installed
+	# (bounded, sessions of closed tabs are never removed)
+	_lifecycle_events_enabled: BoundedDict[str, bool] = PrivateAttr(default_factory=lambda: BoundedDict(maxsize=256))
+	# (session_id, main frame id) -> events of the _wait_for_page_load calls currently waiting on that page
+	_page_load_waiters: dict[tuple[str, str], set[asyncio.Event]] = PrivateAttr(default_factory=dict)
+
 	async def on_ClickElementEvent(self, event: ClickElementEvent) -> dict | None:
 		"""Handle click request with CDP."""
 		try:
@@ -66,14 +164,15 @@ class DefaultActionWatchdog(BaseWatchdog):
 			click_metadata = await self._click_element_node_impl(element_node, while_holding_ctrl=event.while_holding_ctrl)
 			download_path = None  # moved to downloads_watchdog.py
 
-			# Build success message
+			# Log the result (element text and xpath both walk the DOM tree, so only build them when debug logging is on)
 			if download_path:
-				msg = f'Downloaded file to {download_path}'
-				self.logger.info(f'💾 {msg}')
-			else:
-				msg = f'Clicked button with index {index_for_logging}: {element_node.get_all_children_text(max_depth=2)}'
-				self.logger.debug(f'🖱️ {msg}')
-			self.logger.debug(f'Element xpath: {element_node.xpath}')
+				self.logger.info(f'💾 Downloaded file to {download_path}')
+			elif self.logger.isEnabledFor(logging.DEBUG):
+				self.logger.debug(
+					f'🖱️ Clicked button with index {index_for_logging}: {element_node.get_all_children_text(max_depth=2)}'
+				)
+			if self.logger.isEnabledFor(logging.DEBUG):
+				self.logger.debug(f'Element xpath: {element_node.xpath}')
 
 			# Wait a bit for potential new tab to be created
 			# This is necessary because tab creation is async and might not be immediate
@@ -92,9 +191,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 			new_tab_opened = len(new_target_ids) > 0
 
 			if new_target_ids:
-				new_tab_msg = 'New tab opened - switching to it'
-				msg += f' - {new_tab_msg}'
-				self.logger.info(f'🔗 {new_tab_msg}')
+				self.logger.info('🔗 New tab opened - switching to it')
 
 				if not event.while_holding_ctrl:
 					# if while_holding_ctrl=False it means agent was not expecting a new tab to be opened
@@ -136,7 +233,8 @@ class DefaultActionWatchdog(BaseWatchdog):
 						element_node, event.text, clear_existing=event.clear_existing or (not event.text)
 					)
 					self.logger.info(f'⌨️ Typed "{event.text}" into element with index {index_for_logging}')
-					self.logger.debug(f'Element xpath: {element_node.xpath}')
+					if self.logger.isEnabledFor(logging.DEBUG):
+						self.logger.debug(f'Element xpath: {element_node.xpath}')
 					return input_metadata  # Return coordinates if available
 				except Exception as e:
 					# Element not found or error - fall back to typing to the page
@@ -255,24 +353,27 @@ class DefaultActionWatchdog(BaseWatchdog):
 			# Get element bounds
 			backend_node_id = element_node.backend_node_id
 
-			# Get viewport dimensions for visibility checks
-			layout_metrics = await cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=session_id)
+			# Get viewport dimensions for visibility checks and, concurrently since the two are independent,
+			# try DOM.getContentQuads first (best for inline elements and complex layouts)
+			layout_metrics, content_quads_result = await asyncio.gather(
+				cdp_session.cdp_client.send.Page.getLayoutMetrics(session_id=session_id),
+				cdp_session.cdp_client.send.DOM.getContentQuads(params={'backendNodeId': backend_node_id}, session_id=session_id),
+				return_exceptions=True,
+			)
+			if isinstance(layout_metrics, BaseException):
+				raise layout_metrics
 			viewport_width = layout_metrics['layoutViewport']['clientWidth']
 			viewport_height = layout_metrics['layoutViewport']['clientHeight']
 
 			# Try multiple methods to get element geometry
 			quads = []
 
-			# Method 1: Try DOM.getContentQuads first (best for inline elements and complex layouts)
-			try:
-				content_quads_result = await cdp_session.cdp_client.send.DOM.getContentQuads(
-					params={'backendNodeId': backend_node_id}, session_id=session_id
-				)
-				if 'quads' in content_quads_result and content_quads_result['quads']:
-					quads = content_quads_result['quads']
-					self.logger.debug(f'Got {len(quads)} quads from DOM.getContentQuads')
-			except Exception as e:
-				self.logger.debug(f'DOM.getContentQuads failed: {e}')
+			# Method 1: DOM.getContentQuads (fetched above)
+			if isinstance(content_quads_result, BaseException):
+				self.logger.debug(f'DOM.getContentQuads failed: {content_quads_result}')
+			elif 'quads' in content_quads_result and content_quads_result['quads']:
+				quads = content_quads_result['quads']
+				self.logger.debug(f'Got {len(quads)} quads from DOM.getContentQuads')
 
 			# Method 2: Fall back to DOM.getBoxModel
 			if not quads:
@@ -301,6 +402,8 @@ class DefaultActionWatchdog(BaseWatchdog):
 					self.logger.debug(f'DOM.getBoxModel failed: {e}')
 
 			# Method 3: Fall back to JavaScript getBoundingClientRect
+			# (the resolved object id is kept so the JS click fallback below doesn't resolve the node again)
+			object_id = None
 			if not quads:
 				try:
 					result = await cdp_session.cdp_client.send.DOM.resolveNode(
@@ -354,14 +457,15 @@ class DefaultActionWatchdog(BaseWatchdog):
 			if not quads:
 				self.logger.warning('⚠️ Could not get element geometry from any method, falling back to JavaScript click')
 				try:
-					result = await cdp_session.cdp_client.send.DOM.resolveNode(
-						params={'backendNodeId': backend_node_id},
-						session_id=session_id,
-					)
-					assert 'object' in result and 'objectId' in result['object'], (
-						'Failed to find DOM element based on backendNodeId, maybe page content changed?'
-					)
-					object_id = result['object']['objectId']
+					if object_id is None:
+						result = await cdp_session.cdp_client.send.DOM.resolveNode(
+							params={'backendNodeId': backend_node_id},
+							session_id=session_id,
+						)
+						assert 'object' in result and 'objectId' in result['object'], (
+							'Failed to find DOM element based on backendNodeId, maybe page content changed?'
+						)
+						object_id = result['object']['objectId']
 
 					await cdp_session.cdp_client.send.Runtime.callFunctionOn(
 						params={
@@ -625,9 +729,14 @@ class DefaultActionWatchdog(BaseWatchdog):
 		except Exception as e:
 			raise Exception(f'Failed to type to page: {str(e)}')
 
-	def _get_char_modifiers_and_vk(self, char: str) -> tuple[int, int, str]:
+	@staticmethod
+	@functools.lru_cache(maxsize=256)
+	def _get_char_modifiers_and_vk(char: str) -> tuple[int, int, str]:
 		"""Get modifiers, virtual key code, and base key for a character.
 
+		Cached per character, typing repeats the same few characters and the lookup tables below
+		would otherwise be rebuilt for every keystroke.
+
 		Returns:
 			(modifiers, windowsVirtualKeyCode, base_key)
 		"""
@@ -695,8 +804,10 @@ class DefaultActionWatchdog(BaseWatchdog):
 		# Fallback
 		return (0, ord(char.upper()) if char.isalpha() else ord(char), char)
 
-	def _get_key_code_for_char(self, char: str) -> str:
-		"""Get the proper key code for a character (like Playwright does)."""
+	@staticmethod
+	@functools.lru_cache(maxsize=256)
+	def _get_key_code_for_char(char: str) -> str:
+		"""Get the proper key code for a character (like Playwright does). Cached per character."""
 		# Key code mapping for common characters (using proper base keys + modifiers)
 		key_codes = {
 			' ': 'Space',
@@ -752,7 +863,8 @@ class DefaultActionWatchdog(BaseWatchdog):
 			# Strategy 1: Direct JavaScript value setting (most reliable for modern web apps)
 			self.logger.debug('🧹 Clearing text field using JavaScript value setting')
 
-			await cdp_session.cdp_client.send.Runtime.callFunctionOn(
+			# The function returns the value after the input/change handlers ran, so it doubles as the verification
+			clear_result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
 				params={
 					'functionDeclaration': """
 						function() { 
@@ -768,17 +880,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 				session_id=cdp_session.session_id,
 			)
 
-			# Verify clearing worked by checking the value
-			verify_result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
-				params={
-					'functionDeclaration': 'function() { return this.value; }',
-					'objectId': object_id,
-					'returnByValue': True,
-				},
-				session_id=cdp_session.session_id,
-			)
-
-			current_value = verify_result.get('result', {}).get('value', '')
+			current_value = clear_result.get('result', {}).get('value', '')
 			if not current_value:
 				self.logger.debug('✅ Text field cleared successfully using JavaScript')
 				return True
@@ -1200,30 +1302,32 @@ class DefaultActionWatchdog(BaseWatchdog):
 					# Scroll the iframe's content directly
 					scroll_result = await cdp_session.cdp_client.send.Runtime.callFunctionOn(
 						params={
-							'functionDeclaration': f"""
-								function() {{
-									try {{
+							'functionDeclaration': """
+								function(pixels) {
+									try {
 										const doc = this.contentDocument || this.contentWindow.document;
-										if (doc) {{
+										if (doc) {
 											const scrollElement = doc.documentElement || doc.body;
-											if (scrollElement) {{
+											if (scrollElement) {
 												const oldScrollTop = scrollElement.scrollTop;
-												scrollElement.scrollTop += {pixels};
+												scrollElement.scrollTop += pixels;
 												const newScrollTop = scrollElement.scrollTop;
-												return {{
+												return {
 													success: true,
 													oldScrollTop: oldScrollTop,
 													newScrollTop: newScrollTop,
 													scrolled: newScrollTop - oldScrollTop
-												}};
-											}}
-										}}
-										return {{success: false, error: 'Could not access iframe content'}};
-									}} catch (e) {{
-										return {{success: false, error: e.toString()}};
-									}}
-								}}
+												};
+											}
+										}
+										return {success: false, error: 'Could not access iframe content'};
+									} catch (e) {
+										return {success: false, error: e.toString()};
+									}
+								}
 							""",
+							# Constant function source with pixels passed as an argument, nothing to re-format per scroll
+							'arguments': [{'value': pixels}],
 							'objectId': object_id,
 							'returnByValue': True,
 						},
@@ -1310,12 +1414,13 @@ class DefaultActionWatchdog(BaseWatchdog):
 
 			# Navigate to the previous entry
 			previous_entry_id = entries[current_index - 1]['id']
-			await cdp_session.cdp_client.send.Page.navigateToHistoryEntry(
-				params={'entryId': previous_entry_id}, session_id=cdp_session.session_id
+			await self._wait_for_page_load(
+				cdp_session,
+				cdp_session.cdp_client.send.Page.navigateToHistoryEntry(
+					params={'entryId': previous_entry_id}, session_id=cdp_session.session_id
+				),
+				timeout=0.5,
 			)
-
-			# Wait for navigation
-			await asyncio.sleep(0.5)
 			# Navigation is handled by BrowserSession via events
 
 			self.logger.info(f'🔙 Navigated back to {entries[current_index - 1]["url"]}')
@@ -1338,12 +1443,13 @@ class DefaultActionWatchdog(BaseWatchdog):
 
 			# Navigate to the next entry
 			next_entry_id = entries[current_index + 1]['id']
-			await cdp_session.cdp_client.send.Page.navigateToHistoryEntry(
-				params={'entryId': next_entry_id}, session_id=cdp_session.session_id
+			await self._wait_for_page_load(
+				cdp_session,
+				cdp_session.cdp_client.send.Page.navigateToHistoryEntry(
+					params={'entryId': next_entry_id}, session_id=cdp_session.session_id
+				),
+				timeout=0.5,
 			)
-
-			# Wait for navigation
-			await asyncio.sleep(0.5)
 			# Navigation is handled by BrowserSession via events
 
 			self.logger.info(f'🔜 Navigated forward to {entries[current_index + 1]["url"]}')
@@ -1355,10 +1461,9 @@ class DefaultActionWatchdog(BaseWatchdog):
 		cdp_session = await self.browser_session.get_or_create_cdp_session()
 		try:
 			# Reload the target
-			await cdp_session.cdp_client.send.Page.reload(session_id=cdp_session.session_id)
-
-			# Wait for reload
-			await asyncio.sleep(1.0)
+			await self._wait_for_page_load(
+				cdp_session, cdp_session.cdp_client.send.Page.reload(session_id=cdp_session.session_id), timeout=1.0
+			)
 
 			# Note: We don't clear cached state here - let the next state fetch rebuild as needed
 
@@ -1368,6 +1473,66 @@ class DefaultActionWatchdog(BaseWatchdog):
 		except Exception as e:
 			raise
 
+	async def _wait_for_page_load(self, cdp_session, navigation, timeout: float) -> None:
+		"""Run a navigation command and wait for the main frame to fire DOMContentLoaded/load.
+
+		Resolves as soon as the lifecycle event arrives instead of always sleeping. Same-document history
+		navigations (hash changes, pushState entries) never fire load, so Page.navigatedWithinDocument also
+		resolves the wait. `timeout` caps the wait at the old fixed sleep.
+		"""
+		# Register before sending the command so a fast load can't be missed
+		try:
+			loaded = await self._watch_page_load(cdp_session)
+		except Exception as e:
+			# The listener is only an optimization, still send the command and fall back to the fixed sleep
+			self.logger.debug(f'Failed to watch page load, falling back to a {timeout}s sleep: {type(e).__name__}: {e}')
+			await navigation
+			await asyncio.sleep(timeout)
+			return
+		try:
+			await navigation
+			try:
+				await asyncio.wait_for(loaded.wait(), timeout=timeout)
+			except TimeoutError:
+				pass
+		finally:
+			self._unwatch_page_load(cdp_session, loaded)
+
+	async def _watch_page_load(self, cdp_session) -> asyncio.Event:
+		"""Return an event that is set once the main frame loads or navigates within the document."""
+		cdp_client = cdp_session.cdp_client
+		if cdp_session.session_id not in self._lifecycle_events_enabled:
+			# cdp_use keeps a single handler per event and client, so one persistent handler fans out to all waiters
+			# (registering again for another session on a shared client just replaces it with the same handler)
+			cdp_client.register.Page.lifecycleEvent(self._on_page_lifecycle_event)  # type: ignore[arg-type]
+			cdp_client.register.Page.navigatedWithinDocument(self._on_page_navigated_within_document)  # type: ignore[arg-type]
+			await cdp_client.send.Page.setLifecycleEventsEnabled(params={'enabled': True}, session_id=cdp_session.session_id)
+			self._lifecycle_events_enabled[cdp_session.session_id] = True
+
+		loaded = asyncio.Event()
+		self._page_load_waiters.setdefault((cdp_session.session_id, cdp_session.target_id), set()).add(loaded)
+		return loaded
+
+	def _unwatch_page_load(self, cdp_session, loaded: asyncio.Event) -> None:
+		"""Stop notifying an event returned by _watch_page_load."""
+		key = (cdp_session.session_id, cdp_session.target_id)
+		waiters = self._page_load_waiters.get(key)
+		if waiters is not None:
+			waiters.discard(loaded)
+			if not waiters:
+				del self._page_load_waiters[key]
+
+	def _on_page_lifecycle_event(self, event, session_id=None) -> None:
+		if event.get('name') in ('DOMContentLoaded', 'load'):
+			self._notify_page_load_waiters(session_id, event.get('frameId'))
+
+	def _on_page_navigated_within_document(self, event, session_id=None) -> None:
+		self._notify_page_load_waiters(session_id, event.get('frameId'))
+
+	def _notify_page_load_waiters(self, session_id: str | None, frame_id: str | None) -> None:
+		for loaded in self._page_load_waiters.get((session_id, frame_id), ()):  # type: ignore[arg-type]
+			loaded.set()
+
 	async def on_WaitEvent(self, event: WaitEvent) -> None:
 		"""Handle wait request."""
 		try:
@@ -1385,29 +1550,18 @@ class DefaultActionWatchdog(BaseWatchdog):
 	async def on_SendKeysEvent(self, event: SendKeysEvent) -> None:
 		"""Handle send keys request with CDP."""
 		cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
+		keys = event.keys.lower()
 		try:
-			# Parse key combination
-			keys = event.keys.lower()
-
 			# Handle special key combinations
 			if '+' in keys:
 				# Handle modifier keys
 				parts = keys.split('+')
 				key = parts[-1]
 
-				# Calculate modifier bits inline
-				# CDP Modifier bits: Alt=1, Control=2, Meta/Command=4, Shift=8
+				# Calculate modifier bits, unknown modifier names are ignored
 				modifiers = 0
 				for part in parts[:-1]:
-					part_lower = part.lower()
-					if part_lower in ['alt', 'option']:
-						modifiers |= 1  # Alt
-					elif part_lower in ['ctrl', 'control']:
-						modifiers |= 2  # Control
-					elif part_lower in ['meta', 'cmd', 'command']:
-						modifiers |= 4  # Meta/Command
-					elif part_lower in ['shift']:
-						modifiers |= 8  # Shift
+					modifiers |= _KEY_MODIFIER_BITS.get(part, 0)
 
 				# Send key with modifiers
 				# Use rawKeyDown for non-text keys (like shortcuts)
@@ -1429,61 +1583,22 @@ class DefaultActionWatchdog(BaseWatchdog):
 				)
 			else:
 				# Single key
-				key_map = {
-					'enter': 'Enter',
-					'return': 'Enter',
-					'tab': 'Tab',
-					'delete': 'Delete',
-					'backspace': 'Backspace',
-					'escape': 'Escape',
-					'esc': 'Escape',
-					'space': ' ',
-					'up': 'ArrowUp',
-					'down': 'ArrowDown',
-					'left': 'ArrowLeft',
-					'right': 'ArrowRight',
-					'pageup': 'PageUp',
-					'pagedown': 'PageDown',
-					'home': 'Home',
-					'end': 'End',
-				}
-
-				key = key_map.get(keys, keys)
+				key = _SPECIAL_KEYS.get(keys, keys)
 
 				# Keys that need 3-step sequence (produce characters)
 				keys_needing_char_event = ['enter', 'return', 'space']
 
-				# Virtual key codes for proper key identification
-				virtual_key_codes = {
-					'enter': 13,
-					'return': 13,
-					'tab': 9,
-					'escape': 27,
-					'esc': 27,
-					'space': 32,
-					'backspace': 8,
-					'delete': 46,
-					'up': 38,
-					'down': 40,
-					'left': 37,
-					'right': 39,
-					'home': 36,
-					'end': 35,
-					'pageup': 33,
-					'pagedown': 34,
-				}
-
 				if keys in keys_needing_char_event:
 					# 3-step sequence for keys that produce characters
-					vk_code = virtual_key_codes.get(keys, 0)
+					vk_code = _SPECIAL_KEY_CODES.get(keys, 0)
 					char_text = '\r' if keys in ['enter', 'return'] else ' ' if keys == 'space' else ''
 
 					await cdp_session.cdp_client.send.Input.dispatchKeyEvent(
 						params={
 							'type': 'rawKeyDown',
 							'windowsVirtualKeyCode': vk_code,
-							'code': key_map.get(keys, keys),
-							'key': key_map.get(keys, keys),
+							'code': _SPECIAL_KEYS.get(keys, keys),
+							'key': _SPECIAL_KEYS.get(keys, keys),
 						},
 						session_id=cdp_session.session_id,
 					)
@@ -1495,15 +1610,15 @@ class DefaultActionWatchdog(BaseWatchdog):
 						params={
 							'type': 'keyUp',
 							'windowsVirtualKeyCode': vk_code,
-							'code': key_map.get(keys, keys),
-							'key': key_map.get(keys, keys),
+							'code': _SPECIAL_KEYS.get(keys, keys),
+							'key': _SPECIAL_KEYS.get(keys, keys),
 						},
 						session_id=cdp_session.session_id,
 					)
 				else:
 					# 2-step sequence for other keys
-					key_type = 'rawKeyDown' if keys in key_map else 'keyDown'
-					vk_code = virtual_key_codes.get(keys)
+					key_type = 'rawKeyDown' if keys in _SPECIAL_KEYS else 'keyDown'
+					vk_code = _SPECIAL_KEY_CODES.get(keys)
 
 					if vk_code:
 						# Special keys with virtual key codes
@@ -1512,7 +1627,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 								'type': key_type,
 								'key': key,
 								'windowsVirtualKeyCode': vk_code,
-								'code': key_map.get(keys, keys),
+								'code': _SPECIAL_KEYS.get(keys, keys),
 							},
 							session_id=cdp_session.session_id,
 						)
@@ -1521,7 +1636,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 								'type': 'keyUp',
 								'key': key,
 								'windowsVirtualKeyCode': vk_code,
-								'code': key_map.get(keys, keys),
+								'code': _SPECIAL_KEYS.get(keys, keys),
 							},
 							session_id=cdp_session.session_id,
 						)
@@ -1540,7 +1655,7 @@ class DefaultActionWatchdog(BaseWatchdog):
 
 			# Note: We don't clear cached state on Enter; multi_act will detect DOM changes
 			# and rebuild explicitly. We still wait briefly for potential navigation.
-			if 'enter' in event.keys.lower() or 'return' in event.keys.lower():
+			if 'enter' in keys or 'return' in keys:
 				await asyncio.sleep(0.1)
 		except Exception as e:
 			raise
@@ -1586,89 +1701,24 @@ class DefaultActionWatchdog(BaseWatchdog):
 			raise BrowserError('CDP session not initialized - browser may not be connected yet')
 		session_id = self.browser_session.agent_focus.session_id
 
-		# Enable DOM
-		await cdp_client.send.DOM.enable(session_id=session_id)
-
-		# Get document
-		doc = await cdp_client.send.DOM.getDocument(params={'depth': -1}, session_id=session_id)
-		root_node_id = doc['root']['nodeId']
-
-		# Search for text using XPath
-		search_queries = [
-			f'//*[contains(text(), "{event.text}")]',
-			f'//*[contains(., "{event.text}")]',
-			f'//*[@*[contains(., "{event.text}")]]',
-		]
-
-		found = False
-		for query in search_queries:
-			try:
-				# Perform search
-				search_result = await cdp_client.send.DOM.performSearch(params={'query': query}, session_id=session_id)
-				search_id = search_result['searchId']
-				result_count = search_result['resultCount']
-
-				if result_count > 0:
-					# Get the first match
-					node_ids = await cdp_client.send.DOM.getSearchResults(
-						params={'searchId': search_id, 'fromIndex': 0, 'toIndex': 1},
-						session_id=session_id,
-					)
-
-					if node_ids['nodeIds']:
-						node_id = node_ids['nodeIds'][0]
-
-						# Scroll the element into view
-						await cdp_client.send.DOM.scrollIntoViewIfNeeded(params={'nodeId': node_id}, session_id=session_id)
-
-						found = True
-						self.logger.debug(f'📜 Scrolled to text: "{event.text}"')
-						break
-
-				# Clean up search
-				await cdp_client.send.DOM.discardSearchResults(params={'searchId': search_id}, session_id=session_id)
-			except Exception as e:
-				self.logger.debug(f'Search query failed: {query}, error: {e}')
-				continue
-
-		if not found:
-			# Fallback: Try JavaScript search
-			js_result = await cdp_client.send.Runtime.evaluate(
-				params={
-					'expression': f'''
-							(() => {{
-								const walker = document.createTreeWalker(
-									document.body,
-									NodeFilter.SHOW_TEXT,
-									null,
-									false
-								);
-								let node;
-								while (node = walker.nextNode()) {{
-									if (node.textContent.includes("{event.text}")) {{
-										node.parentElement.scrollIntoView({{behavior: 'smooth', block: 'center'}});
-										return true;
-									}}
-								}}
-								return false;
-							}})()
-						'''
-				},
-				session_id=session_id,
-			)
-
-		if js_result.get('result', {}).get('value'):
-			self.logger.debug(f'📜 Scrolled to text: "{event.text}" (via JS)')
+		# Run all search strategies in a single evaluate (XPath text match, XPath descendant match,
+		# XPath attribute match, then a text-node walk), most specific first, instead of one
+		# DOM.performSearch/getSearchResults/scrollIntoViewIfNeeded/discardSearchResults round-trip per query
+		js_result = await cdp_client.send.Runtime.evaluate(
+			params={
+				'expression': f'({_SCROLL_TO_TEXT_JS})({json.dumps(event.text)})',
+				'returnByValue': True,
+			},
+			session_id=session_id,
+		)
+
+		strategy = js_result.get('result', {}).get('value')
+		if strategy:
+			self.logger.debug(f'📜 Scrolled to text: "{event.text}" (via {strategy})')
 			return None
-		else:
-			self.logger.warning(f'⚠️ Text not found: "{event.text}"')
-			raise BrowserError(f'Text not found: "{event.text}"', details={'text': event.text})
 
-		# If we got here and found is True, return None (success)
-		if found:
-			return None
-		else:
-			raise BrowserError(f'Text not found: "{event.text}"', details={'text': event.text})
+		self.logger.warning(f'⚠️ Text not found: "{event.text}"')
+		raise BrowserError(f'Text not found: "{event.text}"', details={'text': event.text})
 
 	async def on_GetDropdownOptionsEvent(self, event: GetDropdownOptionsEvent) -> dict[str, str]:
 		"""Handle get dropdown options request with CDP."""
@@ -1918,13 +1968,13 @@ class DefaultActionWatchdog(BaseWatchdog):
 				selection_script = """
 				function(targetText) {
 					const startElement = this;
+					const targetTextLower = targetText.toLowerCase();
 					
 					// Function to attempt selection on a dropdown element
 					function attemptSelection(element) {
 						// Handle native select elements
 						if (element.tagName.toLowerCase() === 'select') {
 							const options = Array.from(element.options);
-							const targetTextLower = targetText.toLowerCase();
 							
 							for (const option of options) {
 								const optionTextLower = option.text.trim().toLowerCase();
@@ -1964,7 +2014,6 @@ class DefaultActionWatchdog(BaseWatchdog):
 						const role = element.getAttribute('role');
 						if (role === 'menu' || role === 'listbox' || role === 'combobox') {
 							const menuItems = element.querySelectorAll('[role="menuitem"], [role="option"]');
-							const targetTextLower = targetText.toLowerCase();
 							
 							for (const item of menuItems) {
 								if (item.textContent) {
@@ -2012,7 +2061,6 @@ class DefaultActionWatchdog(BaseWatchdog):
 						// Handle Semantic UI or custom dropdowns
 						if (element.classList.contains('dropdown') || element.classList.contains('ui')) {
 							const menuItems = element.querySelectorAll('.item, .option, [data-value]');
-							const targetTextLower = targetText.toLowerCase();
 							
 							for (const item of menuItems) {
 								if (item.textContent) {
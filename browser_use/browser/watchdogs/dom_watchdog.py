@@ -1,6 +1,7 @@
 """DOM watchdog for browser DOM tree management using CDP."""
 
 import asyncio
+import logging
 import time
 from typing import TYPE_CHECKING
 
@@ -41,6 +42,8 @@ class DOMWatchdog(BaseWatchdog):
 
 	# Internal DOM service
 	_dom_service: DomService | None = None
+	# (target_id, time.monotonic()) of the last successful DOM build, lets other watchdogs skip redundant liveness checks
+	_last_dom_rebuild: tuple[str, float] | None = None
 
 	async def on_TabCreatedEvent(self, event: TabCreatedEvent) -> None:
 		# self.logger.debug('Setting up init scripts in browser')
@@ -126,7 +129,9 @@ class DOMWatchdog(BaseWatchdog):
 		self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting tabs info...')
 		tabs_info = await self.browser_session.get_tabs()
 		self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got {len(tabs_info)} tabs')
-		self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Tabs info: {tabs_info}')
+		if self.logger.isEnabledFor(logging.DEBUG):
+			# Formatting every TabInfo is not free, skip it unless it will be logged
+			self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Tabs info: {tabs_info}')
 
 		# Get viewport / scroll position info, remember changing scroll position should invalidate selector_map cache because it only includes visible elements
 		# cdp_session = await self.browser_session.get_or_create_cdp_session(focus=True)
@@ -252,23 +257,24 @@ class DOMWatchdog(BaseWatchdog):
 
 			# Tabs info already fetched at the beginning
 
-			# Get target title safely
-			try:
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page title...')
-				title = await asyncio.wait_for(self.browser_session.get_current_page_title(), timeout=1.0)
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got title: {title}')
-			except Exception as e:
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get title: {e}')
+			# Get target title and comprehensive page info from CDP concurrently, each with its own timeout
+			self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page title and page info from CDP...')
+			title_result, page_info_result = await asyncio.gather(
+				asyncio.wait_for(self.browser_session.get_current_page_title(), timeout=1.0),
+				asyncio.wait_for(self._get_page_info(), timeout=1.0),
+				return_exceptions=True,
+			)
+
+			if isinstance(title_result, BaseException):
+				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get title: {title_result}')
 				title = 'Page'
+			else:
+				title = title_result
+				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got title: {title}')
 
-			# Get comprehensive page info from CDP with timeout
-			try:
-				self.logger.debug('🔍 DOMWatchdog.on_BrowserStateRequestEvent: Getting page info from CDP...')
-				page_info = await asyncio.wait_for(self._get_page_info(), timeout=1.0)
-				self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got page info from CDP: {page_info}')
-			except Exception as e:
+			if isinstance(page_info_result, BaseException):
 				self.logger.debug(
-					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get page info from CDP: {e}, using fallback'
+					f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Failed to get page info from CDP: {page_info_result}, using fallback'
 				)
 				# Fallback to default viewport dimensions
 				viewport = self.browser_session.browser_profile.viewport or {'width': 1280, 'height': 720}
@@ -284,6 +290,10 @@ class DOMWatchdog(BaseWatchdog):
 					pixels_left=0,
 					pixels_right=0,
 				)
+			else:
+				page_info = page_info_result
+				if self.logger.isEnabledFor(logging.DEBUG):
+					self.logger.debug(f'🔍 DOMWatchdog.on_BrowserStateRequestEvent: Got page info from CDP: {page_info}')
 
 			# Check for PDF viewer
 			is_pdf_viewer = page_url.endswith('.pdf') or '/pdf/' in page_url
@@ -382,6 +392,8 @@ class DOMWatchdog(BaseWatchdog):
 			# Update selector map for other watchdogs
 			self.logger.debug('🔍 DOMWatchdog._build_dom_tree_without_highlights: Updating selector maps...')
 			self.selector_map = self.current_dom_state.selector_map
+			if self.browser_session.agent_focus:
+				self._last_dom_rebuild = (self.browser_session.agent_focus.target_id, time.monotonic())
 			# Update BrowserSession's cached selector map
 			if self.browser_session:
 				self.browser_session.update_cached_selector_map(self.selector_map)
@@ -473,8 +485,11 @@ class DOMWatchdog(BaseWatchdog):
 		if not self.browser_session.agent_focus:
 			raise RuntimeError('No active CDP session - browser may not be connected yet')
 
+		# Reuse the pooled session of the already-focused target: focus=True would re-send
+		# Target.activateTarget + Runtime.runIfWaitingForDebugger, which the DOM build and
+		# screenshot of the same state request have already done
 		cdp_session = await self.browser_session.get_or_create_cdp_session(
-			target_id=self.browser_session.agent_focus.target_id, focus=True
+			target_id=self.browser_session.agent_focus.target_id, focus=False
 		)
 
 		# Get layout metrics which includes all the information we need
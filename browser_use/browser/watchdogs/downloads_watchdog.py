@@ -3,6 +3,7 @@
 import asyncio
 import json
 import os
+import re
 import tempfile
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar
@@ -24,10 +25,15 @@ from browser_use.browser.events import (
 	TabCreatedEvent,
 )
 from browser_use.browser.watchdog_base import BaseWatchdog
+from browser_use.utils import BoundedDict
 
 if TYPE_CHECKING:
 	pass
 
+_PDF_URL_RE = re.compile(r'\.pdf|type=application(?:/|%2f)pdf', re.IGNORECASE)
+# In-progress download names (Chrome writes `*.crdownload` / `Unconfirmed *.crdownload` until the download finishes)
+_PARTIAL_DOWNLOAD_SUFFIXES = ('.crdownload', '.part', '.tmp')
+
 
 class DownloadsWatchdog(BaseWatchdog):
 	"""Monitors downloads and handles file download events."""
@@ -50,12 +56,19 @@ class DownloadsWatchdog(BaseWatchdog):
 	# Private state
 	_sessions_with_listeners: set[str] = PrivateAttr(default_factory=set)  # Track sessions that already have download listeners
 	_active_downloads: dict[str, Any] = PrivateAttr(default_factory=dict)
-	_pdf_viewer_cache: dict[str, bool] = PrivateAttr(default_factory=dict)  # Cache PDF viewer status by target URL
+	_pdf_viewer_cache: BoundedDict[str, bool] = PrivateAttr(
+		default_factory=lambda: BoundedDict(maxsize=256)
+	)  # Cache PDF viewer status by target URL
 	_download_cdp_session_setup: bool = PrivateAttr(default=False)  # Track if CDP session is set up
 	_download_cdp_session: Any = PrivateAttr(default=None)  # Store CDP session reference
 	_cdp_event_tasks: set[asyncio.Task] = PrivateAttr(default_factory=set)  # Track CDP event handler tasks
-	_cdp_downloads_info: dict[str, dict[str, Any]] = PrivateAttr(default_factory=dict)  # Map guid -> info
+	_cdp_downloads_info: BoundedDict[str, dict[str, Any]] = PrivateAttr(
+		default_factory=lambda: BoundedDict(maxsize=256)
+	)  # Map guid -> info, finished downloads are never removed on local browsers
 	_use_js_fetch_for_local: bool = PrivateAttr(default=False)  # Guard JS fetch path for local regular downloads
+	_pdf_checks_inflight: dict[tuple[str, str], asyncio.Task] = PrivateAttr(
+		default_factory=dict
+	)  # (target_id, url) -> running PDF check/download
 
 	async def on_BrowserLaunchEvent(self, event: BrowserLaunchEvent) -> None:
 		self.logger.debug(f'[DownloadsWatchdog] Received BrowserLaunchEvent, EventBus ID: {id(self.event_bus)}')
@@ -137,17 +150,41 @@ class DownloadsWatchdog(BaseWatchdog):
 		if not auto_download_enabled:
 			return
 
+		# Coalesce duplicate completions for the same tab and URL (redirects, or the navigation being reported
+		# more than once) onto the check that is already running instead of probing and downloading twice
+		key = (event.target_id, event.url)
+		inflight = self._pdf_checks_inflight.get(key)
+		if inflight is not None:
+			self.logger.debug(f'[DownloadsWatchdog] PDF check already running for {event.url}, waiting for it')
+			await asyncio.shield(inflight)
+			return
+
+		# Awaited rather than backgrounded: the download runs as a fetch inside the page, which the agent's next
+		# action could tear down, and the step that opened the PDF should already see the downloaded file
+		task = asyncio.create_task(self._check_and_download_pdf(event.target_id, event.url))
+		self._pdf_checks_inflight[key] = task
+		try:
+			await task
+		finally:
+			self._pdf_checks_inflight.pop(key, None)
+
+	async def _check_and_download_pdf(self, target_id: TargetID, url: str) -> None:
+		"""Auto-download the page in the given tab if it is showing a PDF."""
 		# Note: Using network-based PDF detection that doesn't require JavaScript
+		self.logger.debug(f'[DownloadsWatchdog] Got target_id={target_id} for tab #{target_id[-4:]}')
 
-		target_id = event.target_id
-		self.logger.debug(f'[DownloadsWatchdog] Got target_id={target_id} for tab #{event.target_id[-4:]}')
+		# Look up the tab's actual URL once, both the PDF check and the download need it
+		page_url = await self._get_target_url(target_id)
+		if page_url is None:
+			self.logger.warning(f'[DownloadsWatchdog] No target info found for {target_id}')
+			return
 
-		is_pdf = await self.check_for_pdf_viewer(target_id)
+		is_pdf = await self.check_for_pdf_viewer(target_id, page_url=page_url)
 		if is_pdf:
-			self.logger.debug(f'[DownloadsWatchdog] 📄 PDF detected at {event.url}, triggering auto-download...')
-			download_path = await self.trigger_pdf_download(target_id)
+			self.logger.debug(f'[DownloadsWatchdog] 📄 PDF detected at {url}, triggering auto-download...')
+			download_path = await self.trigger_pdf_download(target_id, pdf_url=page_url)
 			if not download_path:
-				self.logger.warning(f'[DownloadsWatchdog] ⚠️ PDF download failed for {event.url}')
+				self.logger.warning(f'[DownloadsWatchdog] ⚠️ PDF download failed for {url}')
 
 	def _is_auto_download_enabled(self) -> bool:
 		"""Check if auto-download PDFs is enabled in browser profile."""
@@ -446,21 +483,34 @@ class DownloadsWatchdog(BaseWatchdog):
 				if f.is_file() and not f.name.startswith('.'):
 					initial_files.add(f.name)
 
-		# Poll for new files
+		# Poll for new files, starting fast (small files land almost immediately) and backing off
+		# towards the old 5s cadence for large downloads
 		max_wait = 20  # seconds
-		start_time = asyncio.get_event_loop().time()
+		check_interval = 0.25
+		max_check_interval = 5.0
+		loop = asyncio.get_running_loop()
+		deadline = loop.time() + max_wait
+		last_sizes: dict[str, int] = {}  # file name -> size seen on the previous poll
 
-		while asyncio.get_event_loop().time() - start_time < max_wait:
-			await asyncio.sleep(5.0)  # Check every 5 seconds
+		while (remaining := deadline - loop.time()) > 0:
+			await asyncio.sleep(min(check_interval, remaining))
+			check_interval = min(check_interval * 2, max_check_interval)
 
 			if Path(downloads_dir).exists():
 				for file_path in Path(downloads_dir).iterdir():
-					# Skip hidden files and files that were already there
-					if file_path.is_file() and not file_path.name.startswith('.') and file_path.name not in initial_files:
-						# Check if file has content (> 4 bytes)
+					# Skip hidden files, files that were already there and downloads still being written
+					if (
+						file_path.is_file()
+						and not file_path.name.startswith('.')
+						and file_path.name not in initial_files
+						and not file_path.name.lower().endswith(_PARTIAL_DOWNLOAD_SUFFIXES)
+					):
+						# Check if file has content (> 4 bytes) and stopped growing since the previous poll
 						try:
 							file_size = file_path.stat().st_size
-							if file_size > 4:
+							previous_size = last_sizes.get(file_path.name)
+							last_sizes[file_path.name] = file_size
+							if file_size > 4 and file_size == previous_size:
 								# Found a new download!
 								self.logger.debug(
 									f'[DownloadsWatchdog] ✅ Found downloaded file: {file_path} ({file_size} bytes)'
@@ -605,23 +655,26 @@ class DownloadsWatchdog(BaseWatchdog):
 			if download_id in self._active_downloads:
 				del self._active_downloads[download_id]
 
-	async def check_for_pdf_viewer(self, target_id: TargetID) -> bool:
+	async def _get_target_url(self, target_id: TargetID) -> str | None:
+		"""Get the current URL of a target, or None if the target no longer exists."""
+		targets = await self.browser_session.cdp_client.send.Target.getTargets()
+		target_info = next((t for t in targets['targetInfos'] if t['targetId'] == target_id), None)
+		return target_info.get('url', '') if target_info else None
+
+	async def check_for_pdf_viewer(self, target_id: TargetID, page_url: str | None = None) -> bool:
 		"""Check if the current target is a PDF using network-based detection.
 
 		This method avoids JavaScript execution that can crash WebSocket connections.
 		Returns True if a PDF is detected and should be downloaded.
+		Pass page_url if the target's current URL is already known to skip looking it up.
 		"""
 		self.logger.debug(f'[DownloadsWatchdog] Checking if target {target_id} is PDF viewer...')
 
-		# Get target info to get URL
-		cdp_client = self.browser_session.cdp_client
-		targets = await cdp_client.send.Target.getTargets()
-		target_info = next((t for t in targets['targetInfos'] if t['targetId'] == target_id), None)
-		if not target_info:
-			self.logger.warning(f'[DownloadsWatchdog] No target info found for {target_id}')
-			return False
-
-		page_url = target_info.get('url', '')
+		if page_url is None:
+			page_url = await self._get_target_url(target_id)
+			if page_url is None:
+				self.logger.warning(f'[DownloadsWatchdog] No target info found for {target_id}')
+				return False
 
 		# Check cache first
 		if page_url in self._pdf_viewer_cache:
@@ -637,20 +690,25 @@ class DownloadsWatchdog(BaseWatchdog):
 				self._pdf_viewer_cache[page_url] = True
 				return True
 
-			# Method 2: Check network response headers via CDP (safer than JavaScript)
-			header_is_pdf = await self._check_network_headers_for_pdf(target_id)
-			if header_is_pdf:
-				self.logger.debug(f'[DownloadsWatchdog] PDF detected via network headers: {page_url}')
-				self._pdf_viewer_cache[page_url] = True
-				return True
-
-			# Method 3: Check Chrome's PDF viewer specific URLs
+			# Method 2: Check Chrome's PDF viewer specific URLs (pure string check, before any CDP round-trip)
 			chrome_pdf_viewer = self._is_chrome_pdf_viewer_url(page_url)
 			if chrome_pdf_viewer:
 				self.logger.debug(f'[DownloadsWatchdog] Chrome PDF viewer detected: {page_url}')
 				self._pdf_viewer_cache[page_url] = True
 				return True
 
+			# about:blank, data:, chrome:// etc. can't be a served PDF, skip the navigation history round-trip
+			if urlparse(page_url).scheme not in ('http', 'https', 'file'):
+				self._pdf_viewer_cache[page_url] = False
+				return False
+
+			# Method 3: Check network response headers via CDP (safer than JavaScript)
+			header_is_pdf = await self._check_network_headers_for_pdf(target_id)
+			if header_is_pdf:
+				self.logger.debug(f'[DownloadsWatchdog] PDF detected via network headers: {page_url}')
+				self._pdf_viewer_cache[page_url] = True
+				return True
+
 			# Not a PDF
 			self._pdf_viewer_cache[page_url] = False
 			return False
@@ -665,29 +723,8 @@ class DownloadsWatchdog(BaseWatchdog):
 		if not url:
 			return False
 
-		url_lower = url.lower()
-
-		# Direct PDF file extensions
-		if url_lower.endswith('.pdf'):
-			return True
-
-		# PDF in path
-		if '.pdf' in url_lower:
-			return True
-
-		# PDF MIME type in URL parameters
-		if any(
-			param in url_lower
-			for param in [
-				'content-type=application/pdf',
-				'content-type=application%2fpdf',
-				'mimetype=application/pdf',
-				'type=application/pdf',
-			]
-		):
-			return True
-
-		return False
+		# .pdf anywhere in the URL, or a PDF MIME type in the query (content-type=, mimetype=, type=, url-encoded or not)
+		return _PDF_URL_RE.search(url) is not None
 
 	def _is_chrome_pdf_viewer_url(self, url: str) -> bool:
 		"""Check if this is Chrome's internal PDF viewer URL."""
@@ -739,10 +776,11 @@ class DownloadsWatchdog(BaseWatchdog):
 			self.logger.debug(f'[DownloadsWatchdog] Network headers check failed (non-critical): {e}')
 			return False
 
-	async def trigger_pdf_download(self, target_id: TargetID) -> str | None:
+	async def trigger_pdf_download(self, target_id: TargetID, pdf_url: str | None = None) -> str | None:
 		"""Trigger download of a PDF from Chrome's PDF viewer.
 
 		Returns the download path if successful, None otherwise.
+		Pass pdf_url if the target's current URL is already known to skip reading it from the page.
 		"""
 		self.logger.debug(f'[DownloadsWatchdog] trigger_pdf_download called for target_id={target_id}')
 
@@ -760,36 +798,26 @@ class DownloadsWatchdog(BaseWatchdog):
 			self.logger.debug(f'[DownloadsWatchdog] Creating CDP session for PDF download from target {target_id}')
 			temp_session = await self.browser_session.get_or_create_cdp_session(target_id, focus=False)
 
-			# Try to get the PDF URL with timeout
-			result = await asyncio.wait_for(
-				temp_session.cdp_client.send.Runtime.evaluate(
-					params={
-						'expression': """
-				(() => {
-					// For Chrome's PDF viewer, the actual URL is in window.location.href
-					// The embed element's src is often "about:blank"
-					const embedElement = document.querySelector('embed[type="application/x-google-chrome-pdf"]') ||
-										document.querySelector('embed[type="application/pdf"]');
-					if (embedElement) {
-						// Chrome PDF viewer detected - use the page URL
-						return { url: window.location.href };
-					}
-					// Fallback to window.location.href anyway
-					return { url: window.location.href };
-				})()
-				""",
-						'returnByValue': True,
-					},
-					session_id=temp_session.session_id,
-				),
-				timeout=5.0,  # 5 second timeout to prevent hanging
-			)
-			pdf_info = result.get('result', {}).get('value', {})
-
-			pdf_url = pdf_info.get('url', '')
 			if not pdf_url:
-				self.logger.warning(f'[DownloadsWatchdog] ❌ Could not determine PDF URL for download {pdf_info}')
-				return None
+				# Try to get the PDF URL with timeout
+				# For Chrome's PDF viewer the actual URL is in window.location.href (the embed element's src is often
+				# "about:blank"), and that is also the fallback for any other page, so no embed element lookup is needed
+				result = await asyncio.wait_for(
+					temp_session.cdp_client.send.Runtime.evaluate(
+						params={
+							'expression': '({url: window.location.href})',
+							'returnByValue': True,
+						},
+						session_id=temp_session.session_id,
+					),
+					timeout=5.0,  # 5 second timeout to prevent hanging
+				)
+				pdf_info = result.get('result', {}).get('value', {})
+
+				pdf_url = pdf_info.get('url', '')
+				if not pdf_url:
+					self.logger.warning(f'[DownloadsWatchdog] ❌ Could not determine PDF URL for download {pdf_info}')
+					return None
 
 			# Generate filename from URL
 			pdf_filename = os.path.basename(pdf_url.split('?')[0])  # Remove query params
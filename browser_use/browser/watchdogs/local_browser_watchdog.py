@@ -2,6 +2,7 @@
 
 import asyncio
 import os
+import re
 import shutil
 import tempfile
 from pathlib import Path
@@ -22,6 +23,8 @@ from browser_use.browser.watchdog_base import BaseWatchdog
 if TYPE_CHECKING:
 	pass
 
+_USER_DATA_DIR_ERROR_RE = re.compile(r'singletonlock|user data directory|cannot create|already in use')
+
 
 class LocalBrowserWatchdog(BaseWatchdog):
 	"""Manages local browser subprocess lifecycle."""
@@ -38,6 +41,7 @@ class LocalBrowserWatchdog(BaseWatchdog):
 
 	# Private state for subprocess management
 	_subprocess: psutil.Process | None = PrivateAttr(default=None)
+	_subprocess_handle: asyncio.subprocess.Process | None = PrivateAttr(default=None)  # asyncio handle of the same process
 	_owns_browser_resources: bool = PrivateAttr(default=True)
 	_temp_dirs_to_cleanup: list[Path] = PrivateAttr(default_factory=list)
 	_original_user_data_dir: str | None = PrivateAttr(default=None)
@@ -63,8 +67,9 @@ class LocalBrowserWatchdog(BaseWatchdog):
 		self.logger.debug('[LocalBrowserWatchdog] Killing local browser process')
 
 		if self._subprocess:
-			await self._cleanup_process(self._subprocess)
+			await self._cleanup_process(self._subprocess, self._subprocess_handle)
 			self._subprocess = None
+			self._subprocess_handle = None
 
 		# Clean up temp directories if any were created
 		for temp_dir in self._temp_dirs_to_cleanup:
@@ -158,13 +163,14 @@ class LocalBrowserWatchdog(BaseWatchdog):
 					except Exception:
 						pass
 
+				self._subprocess_handle = subprocess
 				return process, cdp_url
 
 			except Exception as e:
 				error_str = str(e).lower()
 
 				# Check if this is a user_data_dir related error
-				if any(err in error_str for err in ['singletonlock', 'user data directory', 'cannot create', 'already in use']):
+				if _USER_DATA_DIR_ERROR_RE.search(error_str):
 					self.logger.warning(f'Browser launch failed (attempt {attempt + 1}/{max_retries}): {e}')
 
 					if attempt < max_retries - 1:
@@ -356,11 +362,13 @@ class LocalBrowserWatchdog(BaseWatchdog):
 		"""Wait for the browser to start and return the CDP URL."""
 		import aiohttp
 
-		start_time = asyncio.get_event_loop().time()
+		loop = asyncio.get_running_loop()
+		deadline = loop.time() + timeout
 
-		while asyncio.get_event_loop().time() - start_time < timeout:
-			try:
-				async with aiohttp.ClientSession() as session:
+		# Reuse one HTTP session across polls instead of opening a new one every 100ms
+		async with aiohttp.ClientSession() as session:
+			while loop.time() < deadline:
+				try:
 					async with session.get(f'http://localhost:{port}/json/version') as resp:
 						if resp.status == 200:
 							# Chrome is ready
@@ -368,18 +376,19 @@ class LocalBrowserWatchdog(BaseWatchdog):
 						else:
 							# Chrome is starting up and returning 502/500 errors
 							await asyncio.sleep(0.1)
-			except Exception:
-				# Connection error - Chrome might not be ready yet
-				await asyncio.sleep(0.1)
+				except Exception:
+					# Connection error - Chrome might not be ready yet
+					await asyncio.sleep(0.1)
 
 		raise TimeoutError(f'Browser did not start within {timeout} seconds')
 
 	@staticmethod
-	async def _cleanup_process(process: psutil.Process) -> None:
+	async def _cleanup_process(process: psutil.Process, handle: asyncio.subprocess.Process | None = None) -> None:
 		"""Clean up browser process.
 
 		Args:
 			process: psutil.Process to terminate
+			handle: asyncio handle of the same process if we spawned it, used to wait for the exit
 		"""
 		if not process:
 			return
@@ -388,11 +397,19 @@ class LocalBrowserWatchdog(BaseWatchdog):
 			# Try graceful shutdown first
 			process.terminate()
 
-			# Use async wait instead of blocking wait
-			for _ in range(50):  # Wait up to 5 seconds (50 * 0.1)
-				if not process.is_running():
+			if handle is not None:
+				# Resolves as soon as asyncio's child watcher reaps the process, instead of re-polling every 100ms
+				try:
+					await asyncio.wait_for(handle.wait(), timeout=5)
 					return
-				await asyncio.sleep(0.1)
+				except TimeoutError:
+					pass
+			else:
+				# Use async wait instead of blocking wait
+				for _ in range(50):  # Wait up to 5 seconds (50 * 0.1)
+					if not process.is_running():
+						return
+					await asyncio.sleep(0.1)
 
 			# If still running after 5 seconds, force kill
 			if process.is_running():
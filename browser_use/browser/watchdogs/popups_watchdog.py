@@ -8,6 +8,7 @@ from pydantic import PrivateAttr
 
 from browser_use.browser.events import TabCreatedEvent
 from browser_use.browser.watchdog_base import BaseWatchdog
+from browser_use.utils import BoundedDict
 
 
 class PopupsWatchdog(BaseWatchdog):
@@ -17,8 +18,8 @@ class PopupsWatchdog(BaseWatchdog):
 	LISTENS_TO: ClassVar[list[type[BaseEvent]]] = [TabCreatedEvent]
 	EMITS: ClassVar[list[type[BaseEvent]]] = []
 
-	# Track which targets have dialog handlers registered
-	_dialog_listeners_registered: set[str] = PrivateAttr(default_factory=set)
+	# Track which targets have dialog handlers registered (bounded, closed targets are never removed)
+	_dialog_listeners_registered: BoundedDict[str, bool] = PrivateAttr(default_factory=lambda: BoundedDict(maxsize=256))
 
 	def __init__(self, **kwargs):
 		super().__init__(**kwargs)
@@ -104,7 +105,7 @@ class PopupsWatchdog(BaseWatchdog):
 					self.logger.warning(f'Failed to register on root CDP client: {root_error}')
 
 			# Mark this target as having dialog handling set up
-			self._dialog_listeners_registered.add(target_id)
+			self._dialog_listeners_registered[target_id] = True
 
 			self.logger.debug(f'Set up JavaScript dialog handling for tab {target_id}')
 
@@ -252,19 +252,23 @@ class StorageStateWatchdog(BaseWatchdog):
 
 			# Apply origins (localStorage/sessionStorage) if present
 			if 'origins' in storage and storage['origins']:
+				# Collect every setItem() call into a single init script so it is sent and installed once,
+				# instead of one addScriptToEvaluateOnNewDocument round-trip (and one script run per document) per item.
+				# Each call is wrapped so a single failing item (quota, opaque origin) doesn't abort the rest, same as before.
+				statements: list[str] = []
 				for origin in storage['origins']:
 					if 'localStorage' in origin:
 						for item in origin['localStorage']:
-							script = f"""
-								window.localStorage.setItem({json.dumps(item['name'])}, {json.dumps(item['value'])});
-							"""
-							await self.browser_session._cdp_add_init_script(script)
+							statements.append(
+								f'try {{ window.localStorage.setItem({json.dumps(item["name"])}, {json.dumps(item["value"])}); }} catch (e) {{}}'
+							)
 					if 'sessionStorage' in origin:
 						for item in origin['sessionStorage']:
-							script = f"""
-								window.sessionStorage.setItem({json.dumps(item['name'])}, {json.dumps(item['value'])});
-							"""
-							await self.browser_session._cdp_add_init_script(script)
+							statements.append(
+								f'try {{ window.sessionStorage.setItem({json.dumps(item["name"])}, {json.dumps(item["value"])}); }} catch (e) {{}}'
+							)
+				if statements:
+					await self.browser_session._cdp_add_init_script('\n'.join(statements))
 				self.logger.debug(
 					f'[StorageStateWatchdog] Applied localStorage/sessionStorage from {len(storage["origins"])} origins'
 				)
@@ -1,5 +1,35 @@
+import re
+
 from browser_use.dom.views import EnhancedDOMTreeNode, NodeType
 
+# Substrings that mark search widgets, compiled once so each attribute is scanned in a single pass
+# instead of once per indicator (search-icon, search-btn, searchbox, ... are all covered by 'search')
+_SEARCH_INDICATORS_RE = re.compile('search|magnify|glass|lookup|find|query')
+
+# Lookup sets used by is_interactive for every element node, built once at import instead of per call
+# Note: 'label' removed - labels are handled by other attribute checks below - other wise labels with "for" attribute can destroy the real clickable element on apartments.com
+_INTERACTIVE_TAGS = frozenset({'button', 'input', 'select', 'textarea', 'a', 'details', 'summary', 'option', 'optgroup'})
+_INTERACTIVE_ATTRIBUTES = frozenset({'onclick', 'onmousedown', 'onmouseup', 'onkeydown', 'onkeyup', 'tabindex'})
+_INTERACTIVE_ROLES = frozenset(
+	{
+		'button',
+		'link',
+		'menuitem',
+		'option',
+		'radio',
+		'checkbox',
+		'tab',
+		'textbox',
+		'combobox',
+		'slider',
+		'spinbutton',
+		'search',
+		'searchbox',
+	}
+)
+_INTERACTIVE_AX_ROLES = _INTERACTIVE_ROLES | {'listbox'}
+_ICON_ATTRIBUTES = frozenset({'class', 'role', 'onclick', 'data-action', 'aria-label'})
+
 
 class ClickableElementDetector:
 	@staticmethod
@@ -34,32 +64,19 @@ class ClickableElementDetector:
 
 		# SEARCH ELEMENT DETECTION: Check for search-related classes and attributes
 		if node.attributes:
-			search_indicators = {
-				'search',
-				'magnify',
-				'glass',
-				'lookup',
-				'find',
-				'query',
-				'search-icon',
-				'search-btn',
-				'search-button',
-				'searchbox',
-			}
-
 			# Check class names for search indicators
 			class_list = node.attributes.get('class', '').lower().split()
-			if any(indicator in ' '.join(class_list) for indicator in search_indicators):
+			if _SEARCH_INDICATORS_RE.search(' '.join(class_list)):
 				return True
 
 			# Check id for search indicators
 			element_id = node.attributes.get('id', '').lower()
-			if any(indicator in element_id for indicator in search_indicators):
+			if _SEARCH_INDICATORS_RE.search(element_id):
 				return True
 
 			# Check data attributes for search functionality
 			for attr_name, attr_value in node.attributes.items():
-				if attr_name.startswith('data-') and any(indicator in attr_value.lower() for indicator in search_indicators):
+				if attr_name.startswith('data-') and _SEARCH_INDICATORS_RE.search(attr_value.lower()):
 					return True
 
 		# Enhanced accessibility property checks - direct clear indicators only
@@ -95,19 +112,7 @@ class ClickableElementDetector:
 					continue
 
 				# ENHANCED TAG CHECK: Include truly interactive elements
-		# Note: 'label' removed - labels are handled by other attribute checks below - other wise labels with "for" attribute can destroy the real clickable element on apartments.com
-		interactive_tags = {
-			'button',
-			'input',
-			'select',
-			'textarea',
-			'a',
-			'details',
-			'summary',
-			'option',
-			'optgroup',
-		}
-		if node.tag_name in interactive_tags:
+		if node.tag_name in _INTERACTIVE_TAGS:
 			return True
 
 		# SVG elements need special handling - only interactive if they have explicit handlers
@@ -133,49 +138,17 @@ class ClickableElementDetector:
 		# Tertiary check: elements with interactive attributes
 		if node.attributes:
 			# Check for event handlers or interactive attributes
-			interactive_attributes = {'onclick', 'onmousedown', 'onmouseup', 'onkeydown', 'onkeyup', 'tabindex'}
-			if any(attr in node.attributes for attr in interactive_attributes):
+			if not _INTERACTIVE_ATTRIBUTES.isdisjoint(node.attributes):
 				return True
 
 			# Check for interactive ARIA roles
 			if 'role' in node.attributes:
-				interactive_roles = {
-					'button',
-					'link',
-					'menuitem',
-					'option',
-					'radio',
-					'checkbox',
-					'tab',
-					'textbox',
-					'combobox',
-					'slider',
-					'spinbutton',
-					'search',
-					'searchbox',
-				}
-				if node.attributes['role'] in interactive_roles:
+				if node.attributes['role'] in _INTERACTIVE_ROLES:
 					return True
 
 		# Quaternary check: accessibility tree roles
 		if node.ax_node and node.ax_node.role:
-			interactive_ax_roles = {
-				'button',
-				'link',
-				'menuitem',
-				'option',
-				'radio',
-				'checkbox',
-				'tab',
-				'textbox',
-				'combobox',
-				'slider',
-				'spinbutton',
-				'listbox',
-				'search',
-				'searchbox',
-			}
-			if node.ax_node.role in interactive_ax_roles:
+			if node.ax_node.role in _INTERACTIVE_AX_ROLES:
 				return True
 
 		# ICON AND SMALL ELEMENT CHECK: Elements that might be icons
@@ -188,8 +161,7 @@ class ClickableElementDetector:
 			# Check if this small element has interactive properties
 			if node.attributes:
 				# Small elements with these attributes are likely interactive icons
-				icon_attributes = {'class', 'role', 'onclick', 'data-action', 'aria-label'}
-				if any(attr in node.attributes for attr in icon_attributes):
+				if not _ICON_ATTRIBUTES.isdisjoint(node.attributes):
 					return True
 
 		# Final fallback: cursor style indicates interactivity (for cases Chrome missed)
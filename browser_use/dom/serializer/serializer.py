@@ -47,6 +47,12 @@ class DOMTreeSerializer:
 		self._interactive_counter = 1
 		self._selector_map: DOMSelectorMap = {}
 		self._previous_cached_selector_map = previous_cached_state.selector_map if previous_cached_state else None
+		# Backend node ids of the previous selector map, computed once for the is_new check on every interactive node
+		self._previous_backend_node_ids: set[int] = (
+			{node.backend_node_id for node in self._previous_cached_selector_map.values()}
+			if self._previous_cached_selector_map
+			else set()
+		)
 		# Add timing tracking
 		self.timing_info: dict[str, float] = {}
 		# Cache for clickable element detection to avoid redundant calls
@@ -246,8 +252,7 @@ class DOMTreeSerializer:
 
 				# Check if node is new
 				if self._previous_cached_selector_map:
-					previous_backend_node_ids = {node.backend_node_id for node in self._previous_cached_selector_map.values()}
-					if node.original_node.backend_node_id not in previous_backend_node_ids:
+					if node.original_node.backend_node_id not in self._previous_backend_node_ids:
 						node.is_new = True
 
 		# Process children
@@ -1,5 +1,6 @@
 import asyncio
 import logging
+import re
 import time
 from typing import TYPE_CHECKING
 
@@ -29,6 +30,10 @@ if TYPE_CHECKING:
 
 # Note: iframe limits are now configurable via BrowserProfile.max_iframes and BrowserProfile.max_iframe_depth
 
+# Form elements whose visibility gets debug-logged while building the tree (address fields in iframes)
+_DEBUG_FORM_TAGS = frozenset({'INPUT', 'SELECT', 'TEXTAREA', 'LABEL'})
+_DEBUG_FORM_FIELD_RE = re.compile('city|state|zip')
+
 
 class DomService:
 	"""
@@ -289,20 +294,12 @@ class DomService:
 	async def _get_all_trees(self, target_id: TargetID) -> TargetAllTrees:
 		cdp_session = await self.browser_session.get_or_create_cdp_session(target_id=target_id, focus=False)
 
-		# Wait for the page to be ready first
-		try:
-			ready_state = await cdp_session.cdp_client.send.Runtime.evaluate(
-				params={'expression': 'document.readyState'}, session_id=cdp_session.session_id
-			)
-		except Exception as e:
-			pass  # Page might not be ready yet
-		# DEBUG: Log before capturing snapshot
+		# Read document.readyState and the actual scroll positions of all iframes in a single round-trip
+		# (previously two separate Runtime.evaluate calls) before capturing the snapshot
 		self.logger.debug(f'🔍 DEBUG: Capturing DOM snapshot for target {target_id}')
-
-		# Get actual scroll positions for all iframes before capturing snapshot
 		iframe_scroll_positions = {}
 		try:
-			scroll_result = await cdp_session.cdp_client.send.Runtime.evaluate(
+			page_state_result = await cdp_session.cdp_client.send.Runtime.evaluate(
 				params={
 					'expression': """
 					(() => {
@@ -321,21 +318,23 @@ class DomService:
 								// Cross-origin iframe, can't access
 							}
 						});
-						return scrollData;
+						return {readyState: document.readyState, scrollData: scrollData};
 					})()
 					""",
 					'returnByValue': True,
+					'silent': True,
 				},
 				session_id=cdp_session.session_id,
 			)
-			if scroll_result and 'result' in scroll_result and 'value' in scroll_result['result']:
-				iframe_scroll_positions = scroll_result['result']['value']
-				for idx, scroll_data in iframe_scroll_positions.items():
-					self.logger.debug(
-						f'🔍 DEBUG: Iframe {idx} actual scroll position - scrollTop={scroll_data.get("scrollTop", 0)}, scrollLeft={scroll_data.get("scrollLeft", 0)}'
-					)
+			page_state = page_state_result.get('result', {}).get('value') or {}
+			self.logger.debug(f'🔍 DEBUG: document.readyState={page_state.get("readyState")}')
+			iframe_scroll_positions = page_state.get('scrollData') or {}
+			for idx, scroll_data in iframe_scroll_positions.items():
+				self.logger.debug(
+					f'🔍 DEBUG: Iframe {idx} actual scroll position - scrollTop={scroll_data.get("scrollTop", 0)}, scrollLeft={scroll_data.get("scrollLeft", 0)}'
+				)
 		except Exception as e:
-			self.logger.debug(f'Failed to get iframe scroll positions: {e}')
+			self.logger.debug(f'Failed to get page ready state and iframe scroll positions: {e}')
 
 		# Define CDP request factories to avoid duplication
 		def create_snapshot_request():
@@ -478,6 +477,8 @@ class DomService:
 		# Parse snapshot data with everything calculated upfront
 		snapshot_lookup = build_snapshot_lookup(snapshot, device_pixel_ratio)
 
+		debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+
 		async def _construct_enhanced_node(
 			node: Node, html_frames: list[EnhancedDOMTreeNode] | None, total_frame_offset: DOMRect | None
 		) -> EnhancedDOMTreeNode:
@@ -618,19 +619,12 @@ class DomService:
 			# Set visibility using the collected HTML frames
 			dom_tree_node.is_visible = self.is_element_visible_according_to_all_parents(dom_tree_node, updated_html_frames)
 
-			# DEBUG: Log visibility info for form elements in iframes
-			if dom_tree_node.tag_name and dom_tree_node.tag_name.upper() in ['INPUT', 'SELECT', 'TEXTAREA', 'LABEL']:
+			# DEBUG: Log visibility info for form elements in iframes (skipped entirely unless debug logging is on)
+			if debug_enabled and dom_tree_node.tag_name and dom_tree_node.tag_name.upper() in _DEBUG_FORM_TAGS:
 				attrs = dom_tree_node.attributes or {}
 				elem_id = attrs.get('id', '')
 				elem_name = attrs.get('name', '')
-				if (
-					'city' in elem_id.lower()
-					or 'city' in elem_name.lower()
-					or 'state' in elem_id.lower()
-					or 'state' in elem_name.lower()
-					or 'zip' in elem_id.lower()
-					or 'zip' in elem_name.lower()
-				):
+				if _DEBUG_FORM_FIELD_RE.search(f'{elem_id} {elem_name}'.lower()):
 					self.logger.debug(
 						f"🔍 DEBUG: Form element {dom_tree_node.tag_name} id='{elem_id}' name='{elem_name}' - visible={dom_tree_node.is_visible}, bounds={dom_tree_node.snapshot_node.bounds if dom_tree_node.snapshot_node else 'NO_SNAPSHOT'}"
 					)
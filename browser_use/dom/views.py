@@ -352,21 +352,22 @@ class EnhancedDOMTreeNode:
 		if not element.parent_node or not element.parent_node.children_nodes:
 			return 0
 
-		same_tag_siblings = [
-			child
-			for child in element.parent_node.children_nodes
-			if child.node_type == NodeType.ELEMENT_NODE and child.node_name.lower() == element.node_name.lower()
-		]
-
-		if len(same_tag_siblings) <= 1:
+		# Single pass: count same-tag siblings and note our 1-based position among them,
+		# instead of materializing the sibling list and searching it again with list.index()
+		tag_name = element.node_name.lower()
+		count = 0
+		position = 0
+		for child in element.parent_node.children_nodes:
+			if child.node_type == NodeType.ELEMENT_NODE and child.node_name.lower() == tag_name:
+				count += 1
+				if position == 0 and child is element:
+					position = count
+
+		if count <= 1:
 			return 0  # No index needed if it's the only one
 
-		try:
-			# XPath is 1-indexed
-			position = same_tag_siblings.index(element) + 1
-			return position
-		except ValueError:
-			return 0
+		# XPath is 1-indexed, 0 if the element is not among its parent's children
+		return position
 
 	def __json__(self) -> dict:
 		"""Serializes the node and its descendants to a dictionary, omitting parent references."""
@@ -684,13 +685,13 @@ class EnhancedDOMTreeNode:
 
 	def parent_branch_hash(self) -> int:
 		"""
-		Hash the element based on its parent branch path and attributes.
-		"""
-		parent_branch_path = self._get_parent_branch_path()
-		parent_branch_path_string = '/'.join(parent_branch_path)
-		element_hash = hashlib.sha256(parent_branch_path_string.encode()).hexdigest()
+		Fingerprint the element based on its parent branch path.
 
-		return int(element_hash[:16], 16)
+		Only used for in-process change detection between DOM snapshots, so a plain tuple hash is
+		enough - no need to join and sha256 the whole path for every node in the selector map.
+		Not stable across processes, use `element_hash` for anything that gets persisted.
+		"""
+		return hash(tuple(self._get_parent_branch_path()))
 
 	def _get_parent_branch_path(self) -> list[str]:
 		"""Get the parent branch path as a list of tag names from root to current element."""
@@ -1,4 +1,7 @@
+import asyncio
 import json
+import random
+import re
 from dataclasses import dataclass
 from typing import Any, Literal, TypeVar, overload
 
@@ -31,21 +34,31 @@ VerifiedGeminiModels = Literal[
 ]
 
 
-def _is_retryable_error(exception):
-	"""Check if an error should be retried based on error message patterns."""
-	error_msg = str(exception).lower()
+# Lowercase substrings that identify each class of Google API error message
+_RATE_LIMIT_PATTERNS = ('rate limit', 'resource exhausted', 'quota exceeded', 'too many requests', '429')
+_SERVER_ERROR_PATTERNS = ('service unavailable', 'internal server error', 'bad gateway', '503', '502', '500')
+_CONNECTION_PATTERNS = ('connection', 'timeout', 'network', 'unreachable')
 
-	# Rate limit patterns
-	rate_limit_patterns = ['rate limit', 'resource exhausted', 'quota exceeded', 'too many requests', '429']
+# Each group fused into one alternation so a message is scanned once per group instead of once per pattern
+_RATE_LIMIT_RE = re.compile('|'.join(map(re.escape, _RATE_LIMIT_PATTERNS)))
+_SERVER_ERROR_RE = re.compile('|'.join(map(re.escape, _SERVER_ERROR_PATTERNS)))
+_RETRYABLE_RE = re.compile('|'.join(map(re.escape, _RATE_LIMIT_PATTERNS + _SERVER_ERROR_PATTERNS + _CONNECTION_PATTERNS)))
 
-	# Server error patterns
-	server_error_patterns = ['service unavailable', 'internal server error', 'bad gateway', '503', '502', '500']
 
-	# Connection error patterns
-	connection_patterns = ['connection', 'timeout', 'network', 'unreachable']
+# Status codes whose text ('429', '500', ...) is already one of the patterns above
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503})
 
-	all_patterns = rate_limit_patterns + server_error_patterns + connection_patterns
-	return any(pattern in error_msg for pattern in all_patterns)
+
+def _is_retryable_error(exception):
+	"""Check if an error should be retried based on error message patterns."""
+	# google.genai APIErrors carry the HTTP status as .code and lead their message with it,
+	# so check it before formatting the (possibly large) message and scanning it
+	code = getattr(exception, 'code', None)
+	if isinstance(code, int) and code in _RETRYABLE_STATUS_CODES:
+		return True
+
+	error_msg = str(exception).lower()
+	return _RETRYABLE_RE.search(error_msg) is not None
 
 
 @dataclass
@@ -352,13 +365,11 @@ class ChatGoogle(BaseChatModel):
 					return await _make_api_call()
 				except Exception as e:
 					last_exception = e
-					if not _is_retryable_error(e) or attempt == 9:  # Last attempt
+					if attempt == 9 or not _is_retryable_error(e):  # Last attempt
 						break
 
-					# Simple exponential backoff
-					import asyncio
-
-					delay = min(60.0, 1.0 * (2.0**attempt))  # Cap at 60s
+					# Exponential backoff with full jitter, so concurrent agents hitting the same rate limit don't retry in lockstep
+					delay = random.uniform(0, min(60.0, 1.0 * (2.0**attempt)))  # Cap at 60s
 					await asyncio.sleep(delay)
 
 			# Re-raise the last exception if all retries failed
@@ -378,15 +389,10 @@ class ChatGoogle(BaseChatModel):
 			status_code: int | None = None
 
 			# Check if this is a rate limit error
-			if any(
-				indicator in error_message.lower()
-				for indicator in ['rate limit', 'resource exhausted', 'quota exceeded', 'too many requests', '429']
-			):
+			error_message_lower = error_message.lower()
+			if _RATE_LIMIT_RE.search(error_message_lower):
 				status_code = 429
-			elif any(
-				indicator in error_message.lower()
-				for indicator in ['service unavailable', 'internal server error', 'bad gateway', '503', '502', '500']
-			):
+			elif _SERVER_ERROR_RE.search(error_message_lower):
 				status_code = 503
 
 			# Try to extract status code if available
@@ -3,6 +3,7 @@ import enum
 import json
 import logging
 import os
+import re
 from typing import Any, Generic, TypeVar
 
 try:
@@ -64,6 +65,9 @@ Context = TypeVar('Context')
 
 T = TypeVar('T', bound=BaseModel)
 
+# Chrome network errors that mean the site itself is unreachable
+_NETWORK_ERROR_RE = re.compile(r'net::|ERR_(?:NAME_NOT_RESOLVED|INTERNET_DISCONNECTED|CONNECTION_REFUSED|TIMED_OUT)')
+
 
 def handle_browser_error(e: BrowserError) -> ActionResult:
 	if e.long_term_memory is not None:
@@ -204,16 +208,7 @@ class Tools(Generic[Context]):
 					browser_session.logger.error('❌ Browser connection failed - CDP client not properly initialized')
 					return ActionResult(error=f'Browser connection error: {error_msg}')
 				# Check for network-related errors
-				elif any(
-					err in error_msg
-					for err in [
-						'ERR_NAME_NOT_RESOLVED',
-						'ERR_INTERNET_DISCONNECTED',
-						'ERR_CONNECTION_REFUSED',
-						'ERR_TIMED_OUT',
-						'net::',
-					]
-				):
+				elif _NETWORK_ERROR_RE.search(error_msg):
 					site_unavailable_msg = f'Navigation failed - site unavailable: {params.url}'
 					browser_session.logger.warning(f'⚠️ {site_unavailable_msg} - {error_msg}')
 					return ActionResult(error=site_unavailable_msg)
@@ -5,6 +5,7 @@ import platform
 import re
 import signal
 import time
+from collections import OrderedDict
 from collections.abc import Callable, Coroutine
 from fnmatch import fnmatch
 from functools import cache, wraps
@@ -41,6 +42,8 @@ _exiting = False
 # Define generic type variables for return type and parameters
 R = TypeVar('R')
 T = TypeVar('T')
+K = TypeVar('K')
+V = TypeVar('V')
 P = ParamSpec('P')
 
 
@@ -392,6 +395,24 @@ def singleton(cls):
 	return wrapper
 
 
+class BoundedDict(OrderedDict[K, V]):
+	"""Dict holding at most `maxsize` entries, evicting the least recently set key when full.
+
+	Meant for per-URL / per-target bookkeeping on long-lived objects that would otherwise grow for the whole session.
+	"""
+
+	def __init__(self, *args: Any, maxsize: int = 1024, **kwargs: Any) -> None:
+		self.maxsize = maxsize
+		super().__init__(*args, **kwargs)
+
+	def __setitem__(self, key: K, value: V) -> None:
+		if key in self:
+			self.move_to_end(key)
+		super().__setitem__(key, value)
+		if len(self) > self.maxsize:
+			self.popitem(last=False)
+
+
 def check_env_variables(keys: list[str], any_or_all=all) -> bool:
 	"""Check if all required environment variables are set"""
 	return any_or_all(os.getenv(key, '').strip() for key in keys)
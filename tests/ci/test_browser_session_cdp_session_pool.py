@@ -0,0 +1,120 @@
+"""
+Tests for CDP session creation in BrowserSession.get_or_create_cdp_session.
+
+CDPSession.for_target is replaced by a fake that blocks until released, so the tests can
+check that concurrent callers for one target share a single connect without a real browser.
+"""
+
+import asyncio
+
+import pytest
+
+from browser_use.browser import BrowserSession
+from browser_use.browser.session import CDPSession
+
+
+class FakeConnects:
+	"""Replacement for CDPSession.for_target that records calls and blocks until released."""
+
+	def __init__(self):
+		self.calls: list[tuple[str, bool]] = []
+		self.release = asyncio.Event()
+
+	async def for_target(self, cdp_client, target_id, new_socket=False, cdp_url=None, domains=None):
+		self.calls.append((target_id, new_socket))
+		await self.release.wait()
+		return CDPSession.model_construct(
+			cdp_client=cdp_client, target_id=target_id, session_id=f'session-{len(self.calls)}', owns_cdp_client=new_socket
+		)
+
+
+@pytest.fixture
+def connects(monkeypatch):
+	fake = FakeConnects()
+	monkeypatch.setattr(CDPSession, 'for_target', classmethod(lambda cls, *args, **kwargs: fake.for_target(*args, **kwargs)))
+	return fake
+
+
+@pytest.fixture
+def browser_session():
+	session = BrowserSession(cdp_url='http://127.0.0.1:9222')
+	root_client = object()
+	session._cdp_client_root = root_client  # type: ignore[assignment]
+	session.agent_focus = CDPSession.model_construct(cdp_client=root_client, target_id='focused-target', session_id='focused')
+	return session
+
+
+async def _let_tasks_start() -> None:
+	for _ in range(5):
+		await asyncio.sleep(0)
+
+
+class TestConcurrentSessionCreation:
+	"""Concurrent get_or_create_cdp_session calls for a new target."""
+
+	async def test_concurrent_calls_share_one_connect(self, browser_session: BrowserSession, connects: FakeConnects):
+		"""All callers get the same session from a single for_target call, and it ends up in the pool."""
+		callers = [asyncio.create_task(browser_session.get_or_create_cdp_session('new-target', focus=False)) for _ in range(3)]
+		await _let_tasks_start()
+		assert connects.calls == [('new-target', True)]
+
+		connects.release.set()
+		sessions = await asyncio.gather(*callers)
+
+		assert connects.calls == [('new-target', True)]
+		assert sessions[0] is sessions[1] is sessions[2]
+		assert browser_session._cdp_session_pool['new-target'] is sessions[0]
+		assert browser_session._cdp_sessions_connecting == {}
+
+	async def test_later_calls_reuse_pooled_session(self, browser_session: BrowserSession, connects: FakeConnects):
+		"""Once connected, the pooled session is returned without connecting again."""
+		connects.release.set()
+		first = await browser_session.get_or_create_cdp_session('new-target', focus=False)
+		second = await browser_session.get_or_create_cdp_session('new-target', focus=False)
+
+		assert first is second
+		assert len(connects.calls) == 1
+
+	async def test_different_socket_modes_do_not_share(self, browser_session: BrowserSession, connects: FakeConnects):
+		"""A caller asking for a shared socket doesn't join an attempt that opens its own socket (and vice versa)."""
+		own_socket = asyncio.create_task(browser_session.get_or_create_cdp_session('new-target', focus=False))
+		shared_socket = asyncio.create_task(
+			browser_session.get_or_create_cdp_session('new-target', focus=False, new_socket=False)
+		)
+		await _let_tasks_start()
+
+		assert sorted(connects.calls) == [('new-target', False), ('new-target', True)]
+
+		connects.release.set()
+		await asyncio.gather(own_socket, shared_socket)
+		assert browser_session._cdp_sessions_connecting == {}
+
+	async def test_cancelled_caller_does_not_abort_shared_connect(self, browser_session: BrowserSession, connects: FakeConnects):
+		"""Cancelling one waiter leaves the connect running for the others."""
+		first = asyncio.create_task(browser_session.get_or_create_cdp_session('new-target', focus=False))
+		second = asyncio.create_task(browser_session.get_or_create_cdp_session('new-target', focus=False))
+		await _let_tasks_start()
+
+		first.cancel()
+		await _let_tasks_start()
+		connects.release.set()
+
+		session = await second
+		assert first.cancelled()
+		assert browser_session._cdp_session_pool['new-target'] is session
+		assert len(connects.calls) == 1
+
+	async def test_reset_cancels_pending_connects(self, browser_session: BrowserSession, connects: FakeConnects):
+		"""A connect started before reset() must not put its session into the fresh pool."""
+		caller = asyncio.create_task(browser_session.get_or_create_cdp_session('new-target', focus=False))
+		await _let_tasks_start()
+		assert browser_session._cdp_sessions_connecting
+
+		await browser_session.reset()
+		connects.release.set()
+		await _let_tasks_start()
+
+		with pytest.raises(asyncio.CancelledError):
+			await caller
+		assert browser_session._cdp_session_pool == {}
+		assert browser_session._cdp_sessions_connecting == {}
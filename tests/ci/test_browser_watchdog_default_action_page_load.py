@@ -0,0 +1,149 @@
+"""
+Tests for the page load waiters used by DefaultActionWatchdog for back/forward/reload.
+
+Uses a fake CDP client that, like cdp_use, keeps a single handler per event method,
+so overlapping waits on a shared client exercise the fan-out instead of clobbering each other.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from browser_use.browser import BrowserSession
+from browser_use.browser.session import CDPSession
+from browser_use.browser.watchdogs.default_action_watchdog import DefaultActionWatchdog
+
+
+class FakeCDPClient:
+	"""Minimal stand-in for cdp_use's CDPClient: one handler per event method, recorded Page commands."""
+
+	def __init__(self, fail_lifecycle_enable: bool = False):
+		self.handlers = {}
+		self.lifecycle_enabled_sessions: list[str] = []
+		self.fail_lifecycle_enable = fail_lifecycle_enable
+
+		async def set_lifecycle_events_enabled(params, session_id=None):
+			if self.fail_lifecycle_enable:
+				raise RuntimeError('Target closed')
+			self.lifecycle_enabled_sessions.append(session_id)
+
+		self.register = SimpleNamespace(
+			Page=SimpleNamespace(
+				lifecycleEvent=lambda cb: self.handlers.__setitem__('Page.lifecycleEvent', cb),
+				navigatedWithinDocument=lambda cb: self.handlers.__setitem__('Page.navigatedWithinDocument', cb),
+			)
+		)
+		self.send = SimpleNamespace(Page=SimpleNamespace(setLifecycleEventsEnabled=set_lifecycle_events_enabled))
+
+	def emit(self, method: str, event: dict, session_id: str) -> None:
+		self.handlers[method](event, session_id)
+
+
+@pytest.fixture
+def watchdog():
+	browser_session = BrowserSession(cdp_url='http://127.0.0.1:9222')
+	return DefaultActionWatchdog(event_bus=browser_session.event_bus, browser_session=browser_session)
+
+
+def make_session(cdp_client: FakeCDPClient, target_id: str, session_id: str) -> CDPSession:
+	return CDPSession.model_construct(cdp_client=cdp_client, target_id=target_id, session_id=session_id)
+
+
+class TestPageLoadWaiters:
+	"""Waiter registration, notification and removal keyed by (session_id, target_id)."""
+
+	async def test_waiters_are_keyed_by_session_and_main_frame(self, watchdog: DefaultActionWatchdog):
+		"""Overlapping waits for two sessions on a shared client only wake for their own page."""
+		client = FakeCDPClient()
+		session_1 = make_session(client, 'target-1', 'session-1')
+		session_2 = make_session(client, 'target-2', 'session-2')
+
+		loaded_1 = await watchdog._watch_page_load(session_1)
+		loaded_2 = await watchdog._watch_page_load(session_2)
+		assert set(watchdog._page_load_waiters) == {('session-1', 'target-1'), ('session-2', 'target-2')}
+
+		client.emit('Page.lifecycleEvent', {'name': 'load', 'frameId': 'target-1'}, 'session-1')
+		assert loaded_1.is_set()
+		assert not loaded_2.is_set()
+
+		# Removing the first wait must leave the second one registered and working
+		watchdog._unwatch_page_load(session_1, loaded_1)
+		assert set(watchdog._page_load_waiters) == {('session-2', 'target-2')}
+
+		client.emit('Page.lifecycleEvent', {'name': 'DOMContentLoaded', 'frameId': 'target-2'}, 'session-2')
+		assert loaded_2.is_set()
+
+		watchdog._unwatch_page_load(session_2, loaded_2)
+		assert watchdog._page_load_waiters == {}
+
+	async def test_multiple_waiters_on_one_page(self, watchdog: DefaultActionWatchdog):
+		"""Every wait on the same page is woken, and removing one keeps the others."""
+		client = FakeCDPClient()
+		session = make_session(client, 'target-1', 'session-1')
+
+		first = await watchdog._watch_page_load(session)
+		second = await watchdog._watch_page_load(session)
+		assert watchdog._page_load_waiters[('session-1', 'target-1')] == {first, second}
+
+		# Lifecycle events are only enabled once per session
+		assert client.lifecycle_enabled_sessions == ['session-1']
+
+		watchdog._unwatch_page_load(session, first)
+		assert watchdog._page_load_waiters[('session-1', 'target-1')] == {second}
+
+		client.emit('Page.lifecycleEvent', {'name': 'load', 'frameId': 'target-1'}, 'session-1')
+		assert second.is_set()
+		assert not first.is_set()
+
+		watchdog._unwatch_page_load(session, second)
+		assert watchdog._page_load_waiters == {}
+
+	async def test_ignores_other_frames_and_lifecycle_names(self, watchdog: DefaultActionWatchdog):
+		"""Subframe events and lifecycle names other than DOMContentLoaded/load don't wake the wait."""
+		client = FakeCDPClient()
+		session = make_session(client, 'target-1', 'session-1')
+		loaded = await watchdog._watch_page_load(session)
+
+		client.emit('Page.lifecycleEvent', {'name': 'load', 'frameId': 'iframe-1'}, 'session-1')
+		client.emit('Page.lifecycleEvent', {'name': 'init', 'frameId': 'target-1'}, 'session-1')
+		client.emit('Page.lifecycleEvent', {'name': 'load', 'frameId': 'target-1'}, 'other-session')
+		assert not loaded.is_set()
+
+		watchdog._unwatch_page_load(session, loaded)
+
+	async def test_navigated_within_document_wakes_waiter(self, watchdog: DefaultActionWatchdog):
+		"""Same-document navigations never fire load, Page.navigatedWithinDocument resolves the wait instead."""
+		client = FakeCDPClient()
+		session = make_session(client, 'target-1', 'session-1')
+		loaded = await watchdog._watch_page_load(session)
+
+		client.emit('Page.navigatedWithinDocument', {'frameId': 'target-1', 'url': 'https://example.com/#b'}, 'session-1')
+		assert loaded.is_set()
+
+		watchdog._unwatch_page_load(session, loaded)
+		assert watchdog._page_load_waiters == {}
+
+	async def test_wait_for_page_load_returns_early_and_cleans_up(self, watchdog: DefaultActionWatchdog):
+		"""The wait resolves on the lifecycle event instead of running into the timeout, and unregisters itself."""
+		client = FakeCDPClient()
+		session = make_session(client, 'target-1', 'session-1')
+
+		async def navigate():
+			client.emit('Page.lifecycleEvent', {'name': 'load', 'frameId': 'target-1'}, 'session-1')
+
+		await asyncio.wait_for(watchdog._wait_for_page_load(session, navigate(), timeout=5.0), timeout=1.0)
+		assert watchdog._page_load_waiters == {}
+
+	async def test_wait_for_page_load_still_navigates_when_listener_setup_fails(self, watchdog: DefaultActionWatchdog):
+		"""A failing Page.setLifecycleEventsEnabled must not stop the navigation command from being sent."""
+		client = FakeCDPClient(fail_lifecycle_enable=True)
+		session = make_session(client, 'target-1', 'session-1')
+		navigated = []
+
+		async def navigate():
+			navigated.append(True)
+
+		await watchdog._wait_for_page_load(session, navigate(), timeout=0.01)
+		assert navigated == [True]
+		assert watchdog._page_load_waiters == {}
@@ -0,0 +1,60 @@
+"""
+Tests for BoundedDict, the size-capped dict used for per-target / per-URL bookkeeping on watchdogs.
+"""
+
+from browser_use.utils import BoundedDict
+
+
+class TestBoundedDict:
+	"""Eviction order and overwrite behaviour."""
+
+	def test_evicts_oldest_key_when_full(self):
+		"""Inserting past maxsize drops the least recently set key first."""
+		d: BoundedDict[str, int] = BoundedDict(maxsize=3)
+		d['a'] = 1
+		d['b'] = 2
+		d['c'] = 3
+		d['d'] = 4
+
+		assert list(d) == ['b', 'c', 'd']
+
+		d['e'] = 5
+		assert list(d) == ['c', 'd', 'e']
+		assert len(d) == 3
+
+	def test_overwriting_key_refreshes_it_without_evicting(self):
+		"""Setting an existing key updates the value, moves it to the newest slot and doesn't grow the dict."""
+		d: BoundedDict[str, int] = BoundedDict(maxsize=3)
+		d['a'] = 1
+		d['b'] = 2
+		d['c'] = 3
+
+		d['a'] = 10
+		assert list(d) == ['b', 'c', 'a']
+		assert d['a'] == 10
+		assert len(d) == 3
+
+		# 'b' is now the oldest, so it goes first
+		d['d'] = 4
+		assert list(d) == ['c', 'a', 'd']
+
+	def test_reads_do_not_change_eviction_order(self):
+		"""Only setting a key refreshes it, lookups and membership checks don't."""
+		d: BoundedDict[str, bool] = BoundedDict(maxsize=2)
+		d['a'] = True
+		d['b'] = True
+
+		assert 'a' in d
+		assert d.get('a') is True
+
+		d['c'] = True
+		assert list(d) == ['b', 'c']
+
+	def test_default_maxsize(self):
+		"""Without an explicit maxsize the dict holds 1024 entries."""
+		d: BoundedDict[int, int] = BoundedDict()
+		for i in range(1100):
+			d[i] = i
+
+		assert len(d) == 1024
+		assert next(iter(d)) == 1100 - 1024